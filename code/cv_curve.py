@@ -22,33 +22,31 @@ Input:
 - An Excel file specified by the 'file_path' variable, containing:
   - Column 'Ewe/V' for electrode potential (vs. RHE).
   - Column '<I>/mA' for measured current in milliamperes.
+- The parsed columns are cached next to the Excel file (see data_io.py), so later runs
+  skip the Excel parsing.
 
 Output:
 - A PNG file './figures/cv_curve.png' containing the CV plot in a visually appealing format.
 
 Dependencies:
 - pandas
+- openpyxl
 - matplotlib
 '''
-import pandas as pd
 import matplotlib.pyplot as plt
-from matplotlib import rcParams
+
+from data_io import read_excel_cached
+from plot_style import FIG_DPI, SHOW_PLOTS, apply_mdpi_style
 
 # Set font style for MDPI article format
-rcParams.update(
+apply_mdpi_style(
     {
-        "font.family": "serif",  # Use serif font style (e.g., Times New Roman)
-        "mathtext.fontset": "stix",  # Use STIX fonts for math
         "font.size": 12,  # Set base font size
         "axes.titlesize": 18,  # Set size of axis titles
         "axes.labelsize": 18,  # Set size of axis labels
         "xtick.labelsize": 14,  # Set size of x-axis tick labels
         "ytick.labelsize": 14,  # Set size of y-axis tick labels
         "legend.fontsize": 18,  # Set size of legend text
-        "figure.figsize": (
-            8,
-            6,
-        ),  # Define default figure size (width, height in inches)
     }
 )
 
@@ -60,25 +58,28 @@ output_file_path = "./figures/cv_curve.png"
 # Print the file paths being used
 print(f"Reading data from: {file_path}, sheet: {sheet_name}")
 
-# Load the Excel data
-data = pd.read_excel(file_path, sheet_name=sheet_name)
+# Load the Excel data, reusing the cached copy when available
+data = read_excel_cached(file_path, sheet_name=sheet_name, usecols=["Ewe/V", "<I>/mA"])
 
 # Extract data for plotting
-x = data["Ewe/V"]
-y = data["<I>/mA"]
+x = data["Ewe/V"].to_numpy()
+y = data["<I>/mA"].to_numpy()
 
 # Plot the CV curve
-plt.figure(figsize=(8, 6))
-plt.plot(x, y, color="black", linewidth=1.5)
+fig, ax = plt.subplots()  # Figure size from rcParams (8 x 6 inches)
+# Rasterize the dense trace when saving to vector formats (no effect on PNG output)
+ax.plot(x, y, color="black", linewidth=1.5, rasterized=True)
 
-plt.xlabel(r"$E_{\mathrm{we}} \, \mathrm{vs.} \, \mathrm{RHE} \, (\mathrm{V})$")
-plt.ylabel(r"$\langle I \rangle \, (\mathrm{mA})$")
-plt.grid(True, linestyle="--", alpha=0.6)
-plt.tight_layout()
+ax.set_xlabel(r"$E_{\mathrm{we}} \, \mathrm{vs.} \, \mathrm{RHE} \, (\mathrm{V})$")
+ax.set_ylabel(r"$\langle I \rangle \, (\mathrm{mA})$")
+ax.grid(True, linestyle="--", alpha=0.6)
+fig.tight_layout()
 
 # Save the plot as a PNG file
 print(f"The plot will be saved to: {output_file_path}")
-plt.savefig(output_file_path, dpi=300)
+fig.savefig(output_file_path, dpi=FIG_DPI)
 
 # Display the plot
-plt.show()
+if SHOW_PLOTS:
+    plt.show()
+plt.close(fig)
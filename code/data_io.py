@@ -0,0 +1,110 @@
+# Copyright 2025 Takahiro Matsumoto, Japan Synchrotron Radiation Research Institute
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Shared data loading helpers for the figure scripts.
+
+Key Features:
+- Reads a sheet from an Excel workbook once and caches the parsed DataFrame in a
+  pickle file next to the workbook (e.g. './data/<name>.<sheet>.pkl').
+- Subsequent runs load the cache directly, skipping the XLSX (zip + XML) parsing.
+- Only the requested columns are parsed ('usecols'), which skips the cells of unused columns.
+- The cache is refreshed automatically whenever the workbook is newer than the cache or a
+  different column selection is requested.
+- Arrays computed from a data file (e.g., background-corrected spectra) can be cached the
+  same way in an .npz file next to the data file (e.g. './data/<name>.<tag>.npz'). The
+  cache is keyed on the parameters and the source code of the computation, so it is
+  refreshed whenever one of them changes.
+
+Dependencies:
+- numpy
+- pandas
+- openpyxl
+"""
+import hashlib
+import inspect
+import os
+
+import numpy as np
+import pandas as pd
+
+
+# Function to read an Excel sheet through a pickle cache
+def read_excel_cached(file_path, sheet_name, usecols=None):
+    """
+    Read a sheet from an Excel file, reusing a cached copy when it is up to date.
+
+    Parameters:
+        file_path (str): Path to the Excel file.
+        sheet_name (str): Name of the sheet to load.
+        usecols (list, optional): Names of the columns to load (all columns if None).
+
+    Returns:
+        pandas.DataFrame: Contents of the sheet.
+    """
+    cache_path = f"{os.path.splitext(file_path)[0]}.{sheet_name}.pkl"
+
+    # Use the cache only if it was written after the last change of the workbook
+    # and holds the same column selection
+    if os.path.exists(cache_path) and os.path.getmtime(
+        cache_path
+    ) >= os.path.getmtime(file_path):
+        df = pd.read_pickle(cache_path)
+        if df.attrs.get("usecols") == usecols:
+            return df
+
+    df = pd.read_excel(
+        file_path, sheet_name=sheet_name, usecols=usecols, engine="openpyxl"
+    )
+    df.attrs["usecols"] = usecols
+    df.to_pickle(cache_path)
+    return df
+
+
+# Function to reuse arrays computed from a data file through an .npz cache
+def cached_arrays(file_path, tag, params, compute, functions):
+    """
+    Return arrays computed from a data file, reusing a cached copy when it is up to date.
+
+    Parameters:
+        file_path (str): Path to the data file the arrays are computed from.
+        tag (str): Name of the computation (part of the cache file name).
+        params (tuple): Numeric parameters of the computation (e.g., the energy range).
+        compute (callable): Function without arguments returning a tuple of arrays,
+            called only when the cache is missing or out of date.
+        functions (tuple): Functions that carry out the computation; their source
+            code is part of the cache key.
+
+    Returns:
+        tuple: The computed arrays (numpy.ndarray).
+    """
+    cache_path = f"{os.path.splitext(file_path)[0]}.{tag}.npz"
+
+    # Key of the computation: its parameters and the source code of its functions
+    # (a change of the code, e.g. of a default tolerance, invalidates the cache)
+    key = hashlib.sha256(
+        repr((tuple(params), [inspect.getsource(f) for f in functions])).encode()
+    ).hexdigest()
+
+    # Use the cache only if it was written after the last change of the data file
+    # and was computed with the same parameters and code
+    if os.path.exists(cache_path) and os.path.getmtime(
+        cache_path
+    ) >= os.path.getmtime(file_path):
+        with np.load(cache_path) as cache:
+            if "key" in cache.files and cache["key"].item() == key:
+                return tuple(cache[f"arr_{i}"] for i in range(len(cache.files) - 1))
+
+    arrays = tuple(compute())
+    np.savez(cache_path, *arrays, key=np.asarray(key))
+    return arrays
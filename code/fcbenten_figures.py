@@ -0,0 +1,51 @@
+# Copyright 2025 Takahiro Matsumoto, Japan Synchrotron Radiation Research Institute
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+This script generates both FC-Benten figures (particle size and lattice strain) in one run.
+
+Key Features:
+- Loads the 'data' sheet once and passes it to the 'make_figure' functions of
+  'fcbenten_particle_size.py' and 'fcbenten_lattice_strain.py'.
+- Python, matplotlib and the MDPI style are initialized only once for both figures.
+
+Input:
+- The script reads data from a CSV file: './data/fcbenten_standard_sample_data.csv'
+  (exported from the Excel workbook by 'xlsx_to_csv.py').
+
+Output:
+- './figures/fcbenten_particle_size.png'
+- './figures/fcbenten_lattice_strain.png'
+
+Dependencies:
+- pandas
+- matplotlib
+"""
+import pandas as pd
+
+import fcbenten_lattice_strain
+import fcbenten_particle_size
+
+# Both scripts read the same file and columns
+file_path = fcbenten_particle_size.file_path
+usecols = fcbenten_particle_size.usecols
+
+# Print the file paths being used
+print(f"Reading data from: {file_path}")
+
+# Load the required columns once
+df = pd.read_csv(file_path, usecols=usecols)
+
+# Generate both figures from the same data
+fcbenten_particle_size.make_figure(df, fcbenten_particle_size.output_file_path)
+fcbenten_lattice_strain.make_figure(df, fcbenten_lattice_strain.output_file_path)
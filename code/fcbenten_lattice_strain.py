@@ -26,117 +26,129 @@ Output:
 - A publication-ready plot saved as './figures/fcbenten_lattice_strain.png' in 300 dpi.
 
 Input:
-- The script reads data from an Excel file: './data/fcbenten_standard_sample_data.xlsx'.
-- The required sheet name is 'data'.
+- The script reads data from a CSV file: './data/fcbenten_standard_sample_data.csv'.
+- The CSV file is exported from the 'data' sheet of './data/fcbenten_standard_sample_data.xlsx'
+  by 'xlsx_to_csv.py'.
 
 Dependencies:
 - pandas
 - matplotlib
-- openpyxl
 """
 import matplotlib.pyplot as plt
-import pandas as pd  # Import pandas library
-from matplotlib import rcParams
+import pandas as pd
+
+from plot_style import FIG_DPI, SHOW_PLOTS, apply_mdpi_style
 
 # Set font style for MDPI article format
-rcParams.update(
+apply_mdpi_style(
     {
-        "font.family": "serif",  # Use a serif font like Times New Roman
-        "mathtext.fontset": "stix",  # Use STIX fonts for math
         "font.size": 12,  # Adjust font size to MDPI recommendations
         "axes.titlesize": 14,  # Larger title size
         "axes.labelsize": 16,  # Axis label size
         "xtick.labelsize": 12,  # X-axis tick label size
         "ytick.labelsize": 12,  # Y-axis tick label size
         "legend.fontsize": 10,  # Legend font size
-        "figure.figsize": (8, 6),  # Default figure size
     }
 )
 
-# 1. Specify the path of the Excel file to load.
-file_path = "./data/fcbenten_standard_sample_data.xlsx"
-
-# Print the file paths being used
-print(f"Reading data from: {file_path}")
-
-# 2. Check the sheet names in the Excel file.
-excel_file = pd.ExcelFile(file_path)  # Load the entire Excel file
-print("Available sheets in the Excel file:")
-print(excel_file.sheet_names)  # Display the list of sheet names
-
-# 3. Specify and load the required sheet.
-df = pd.read_excel(file_path, sheet_name="data")  # 'data' is the target sheet name
-
-# 4. Display the DataFrame content to verify the data.
-# print(df.head())  # Check the first 5 rows
-
-
-# Create the plot
-fig, ax = plt.subplots(figsize=(8, 6))  # Maintain a square plotting area
-
-# Categorize samples into Pt and Pt-Co groups
-pt_co_samples = ["TEC35V31E", "TEC36E52", "TEC36F52"]
-pt_samples = [sample for sample in df["Sample"].unique() if sample not in pt_co_samples]
-
-pt_co_samples_latex = [rf"$\mathrm{{{sample}}}$" for sample in pt_co_samples]
-pt_samples_latex = [rf"$\mathrm{{{sample}}}$" for sample in pt_samples]
-
-# Define marker styles and colors for each sample
-all_markers = [
-    "o",
-    "s",
-    "^",
-    "D",
-    "v",
-    "P",
-    "*",
-    "X",
-    "<",
-    ">",
-    "h",
-    "H",
-    "8",
-    "|",
-    "_",
-]  # 15 different marker shapes
-pt_markers = all_markers[: len(pt_samples)]  # Markers for Pt samples
-pt_co_markers = all_markers[
-    len(pt_samples) : len(pt_samples) + len(pt_co_samples)
-]  # Markers for Pt-Co samples
-
-# Define color palettes
-pt_colors = plt.cm.Reds(
-    range(50, 250, int(200 / len(pt_samples)))
-)  # Warm colors for Pt
-pt_co_colors = plt.cm.Blues(
-    range(50, 250, int(200 / len(pt_co_samples)))
-)  # Cool colors for Pt-Co
-
-# Define arrow colors (distinct from red/blue)
-h_arrow_color = "darkgreen"  # Color for H transition arrows
-ec_arrow_color = "darkslategray"  # Color for EC transition arrows
-
-sample_styles = {}
-
-# Plot transitions for each sample: AsMade -> H -> EC
-for sample in df["Sample"].unique():
-    subset = df[df["Sample"] == sample]
-    if {"AsMade", "H", "EC"}.issubset(set(subset["pretreatment"])):
-        asmade = subset[subset["pretreatment"] == "AsMade"]
-        h = subset[subset["pretreatment"] == "H"]
-        ec = subset[subset["pretreatment"] == "EC"]
-
-        x0, y0 = asmade["SAXS_d"].values[0], asmade["XRD_ws"].values[0]
-        x1, y1 = h["SAXS_d"].values[0], h["XRD_ws"].values[0]
-        x2, y2 = ec["SAXS_d"].values[0], ec["XRD_ws"].values[0]
+# Path of the CSV file to load and the path of the output figure
+file_path = "./data/fcbenten_standard_sample_data.csv"
+output_file_path = "./figures/fcbenten_lattice_strain.png"
+
+# Columns read from the exported CSV file (the union of the columns used by both
+# fcbenten scripts, so that fcbenten_figures.py loads them once for both figures)
+usecols = ["Sample", "pretreatment", "SAXS_d", "SAXS_d_width", "XRD_sd", "XRD_ws"]
+
+
+# Function to plot the transitions of particle size (SAXS) and lattice strain (XRD)
+def make_figure(df, out_path):
+    """
+    Plot the AsMade -> H -> EC transitions of all samples and save the figure.
+
+    Parameters:
+        df (pandas.DataFrame): Contents of the 'data' sheet.
+        out_path (str): Path of the output PNG file.
+    """
+    # Create the plot
+    fig, ax = plt.subplots()  # Figure size from rcParams (8 x 6 inches)
+
+    # Categorize samples into Pt and Pt-Co groups
+    pt_co_samples = ["TEC35V31E", "TEC36E52", "TEC36F52"]
+    pt_samples = [sample for sample in df["Sample"].unique() if sample not in pt_co_samples]
+
+    pt_co_samples_latex = [rf"$\mathrm{{{sample}}}$" for sample in pt_co_samples]
+    pt_samples_latex = [rf"$\mathrm{{{sample}}}$" for sample in pt_samples]
+
+    # Define marker styles and colors for each sample
+    all_markers = [
+        "o",
+        "s",
+        "^",
+        "D",
+        "v",
+        "P",
+        "*",
+        "X",
+        "<",
+        ">",
+        "h",
+        "H",
+        "8",
+        "|",
+        "_",
+    ]  # 15 different marker shapes
+    pt_markers = all_markers[: len(pt_samples)]  # Markers for Pt samples
+    pt_co_markers = all_markers[
+        len(pt_samples) : len(pt_samples) + len(pt_co_samples)
+    ]  # Markers for Pt-Co samples
+
+    # Define color palettes
+    pt_colors = plt.cm.Reds(
+        range(50, 250, int(200 / len(pt_samples)))
+    )  # Warm colors for Pt
+    pt_co_colors = plt.cm.Blues(
+        range(50, 250, int(200 / len(pt_co_samples)))
+    )  # Cool colors for Pt-Co
+
+    # Define arrow colors (distinct from red/blue)
+    h_arrow_color = "darkgreen"  # Color for H transition arrows
+    ec_arrow_color = "darkslategray"  # Color for EC transition arrows
+
+    # Positions of the samples in their group, for looking up the marker and color
+    pt_index = {sample: i for i, sample in enumerate(pt_samples)}
+    pt_co_index = {sample: i for i, sample in enumerate(pt_co_samples)}
+
+    sample_styles = {}
+
+    # Points of all samples grouped by marker and color, plotted with one scatter call per style
+    points_by_style = {}
+
+    # Arrange the values by sample (rows) and pretreatment (second column level),
+    # keeping the sample order of the sheet
+    pivot = (
+        df.set_index(["Sample", "pretreatment"])[["SAXS_d", "XRD_ws", "SAXS_d_width"]]
+        .unstack("pretreatment")
+        .reindex(df["Sample"].unique())
+    )
+
+    # Keep only the samples measured after all three treatments
+    pivot = pivot.dropna(subset=[("SAXS_d", t) for t in ("AsMade", "H", "EC")])
+
+    # Plot transitions for each sample: AsMade -> H -> EC
+    for sample, row in pivot.iterrows():
+        x0, y0 = row["SAXS_d", "AsMade"], row["XRD_ws", "AsMade"]
+        x1, y1 = row["SAXS_d", "H"], row["XRD_ws", "H"]
+        x2, y2 = row["SAXS_d", "EC"], row["XRD_ws", "EC"]
 
         # Distinguish styles for Pt and Pt-Co samples
-        if sample in pt_samples:
-            marker = pt_markers[pt_samples.index(sample)]
-            color = pt_colors[pt_samples.index(sample)]
+        idx = pt_index.get(sample)
+        if idx is not None:
+            marker = pt_markers[idx]
+            color = pt_colors[idx]
         else:
-            marker = pt_co_markers[pt_co_samples.index(sample)]
-            color = pt_co_colors[pt_co_samples.index(sample)]
+            idx = pt_co_index[sample]
+            marker = pt_co_markers[idx]
+            color = pt_co_colors[idx]
 
         sample_styles[sample] = {"marker": marker, "color": color}
         style = sample_styles[sample]
@@ -161,62 +173,81 @@ for sample in df["Sample"].unique():
             ),
         )
 
-        # Plot each point (small size, with specific shape and color)
-        ax.scatter(
-            [x0, x1, x2],
-            [y0, y1, y2],
-            s=30,
-            label=sample,
-            marker=style["marker"],
-            color=style["color"],
-            alpha=0.7,
+        # Collect the points of this sample (plotted after the loop)
+        xs, ys, labels = points_by_style.setdefault(
+            (style["marker"], tuple(style["color"])), ([], [], [])
         )
+        xs.extend([x0, x1, x2])
+        ys.extend([y0, y1, y2])
+        labels.append(sample)
 
         # Plot SAXS_d_width for AsMade
-        if "SAXS_d_width" in asmade.columns:
-            x_error = asmade["SAXS_d_width"].values[0]
-            ax.errorbar(
-                x0,
-                y0,
-                xerr=x_error,
-                fmt="none",
-                ecolor=style["color"],
-                linestyle=":",
-                alpha=0.5,
-                capsize=2,
-            )
-
-# Add gridlines
-ax.grid(visible=True, which="both", linestyle="--", linewidth=0.5, alpha=0.7)
-
-# Add labels and title
-ax.set_xlabel(r"$\mathrm{Particle \,\,Size \,\, by \,\, SAXS \,\, (nm)}$")
-ax.set_ylabel(r"$\mathrm{Lattice \,\, Strain}$")
-ax.set_title(
-    r"$\mathrm{Transition \,\, of \,\, Particle \,\, Size \,\, and \,\, Lattice \,\, Strain:}$"
-    "\n"
-    r"$\mathrm{From \,\, AsMade \,\, to \,\, H \,\, (Solid \,\, Green) \,\, and \,\, EC \,\, (Dashed \,\, Gray)}$"
-)
+        x_error = row["SAXS_d_width", "AsMade"]
+        ax.errorbar(
+            x0,
+            y0,
+            xerr=x_error,
+            fmt="none",
+            ecolor=style["color"],
+            linestyle=":",
+            alpha=0.5,
+            capsize=2,
+        )
 
-# Ensure 0 is included in both x and y ticks
-ax.set_xticks(sorted(set(ax.get_xticks()).union({0})))  # Include 0 in x-axis ticks
-ax.set_yticks(sorted(set(ax.get_yticks()).union({0})))  # Include 0 in y-axis ticks
-
-# Add the legend to the right of the plot
-handles, labels = ax.get_legend_handles_labels()
-by_label = dict(zip(labels, handles))  # Remove duplicates
-ax.legend(
-    by_label.values(),
-    by_label.keys(),
-    title="Sample",
-    loc="center left",
-    bbox_to_anchor=(1, 0.5),
-    frameon=False,
-)
+    # Plot the points (small size, with specific shape and color)
+    for (marker, color), (xs, ys, labels) in points_by_style.items():
+        ax.scatter(
+            xs,
+            ys,
+            s=30,
+            label=", ".join(labels),
+            marker=marker,
+            color=color,
+            alpha=0.7,
+        )
 
-# Adjust layout and save plot
-plt.tight_layout()
-output_file_path = "./figures/fcbenten_lattice_strain.png"
-print(f"The plot will be saved to: {output_file_path}")
-plt.savefig(output_file_path, dpi=300, bbox_inches="tight")
-plt.show()
+    # Add gridlines
+    ax.grid(visible=True, which="both", linestyle="--", linewidth=0.5, alpha=0.7)
+
+    # Add labels and title
+    ax.set_xlabel(r"$\mathrm{Particle \,\,Size \,\, by \,\, SAXS \,\, (nm)}$")
+    ax.set_ylabel(r"$\mathrm{Lattice \,\, Strain}$")
+    ax.set_title(
+        r"$\mathrm{Transition \,\, of \,\, Particle \,\, Size \,\, and \,\, Lattice \,\, Strain:}$"
+        "\n"
+        r"$\mathrm{From \,\, AsMade \,\, to \,\, H \,\, (Solid \,\, Green) \,\, and \,\, EC \,\, (Dashed \,\, Gray)}$"
+    )
+
+    # Ensure 0 is included in both x and y ticks
+    ax.set_xticks(sorted(set(ax.get_xticks()).union({0})))  # Include 0 in x-axis ticks
+    ax.set_yticks(sorted(set(ax.get_yticks()).union({0})))  # Include 0 in y-axis ticks
+
+    # Add the legend to the right of the plot
+    handles, labels = ax.get_legend_handles_labels()
+    by_label = dict(zip(labels, handles))  # Remove duplicates
+    ax.legend(
+        by_label.values(),
+        by_label.keys(),
+        title="Sample",
+        loc="center left",
+        bbox_to_anchor=(1, 0.5),
+        frameon=False,
+    )
+
+    # Adjust layout and save plot
+    fig.tight_layout()
+    print(f"The plot will be saved to: {out_path}")
+    fig.savefig(out_path, dpi=FIG_DPI, bbox_inches="tight")
+    if SHOW_PLOTS:
+        plt.show()
+    plt.close(fig)
+
+
+if __name__ == "__main__":
+    # Print the file paths being used
+    print(f"Reading data from: {file_path}")
+
+    # Load the required columns
+    df = pd.read_csv(file_path, usecols=usecols)
+
+    make_figure(df, output_file_path)
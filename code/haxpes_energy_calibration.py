@@ -51,66 +51,61 @@ Input:
 Dependencies:
 - matplotlib
 - numpy
-- scipy
 """
+import io
 import matplotlib.pyplot as plt
+import mmap
 import numpy as np
 import re
 
-from scipy import interpolate
-from matplotlib import rcParams
+from plot_style import SHOW_PLOTS, apply_mdpi_style
 
 # Set font style for MDPI article format
-rcParams.update(
+apply_mdpi_style(
     {
-        "font.family": "serif",  # Use a serif font like Times New Roman
-        "mathtext.fontset": "stix",  # Use STIX fonts for math
         "font.size": 20,  # Adjust font size to MDPI recommendations
         "axes.titlesize": 18,  # Larger title size
         "axes.labelsize": 20,  # Axis label size
         "xtick.labelsize": 14,  # X-axis tick label size
         "ytick.labelsize": 14,  # Y-axis tick label size
         "legend.fontsize": 14,  # Legend font size
-        "figure.figsize": (8, 6),  # Default figure size
     }
 )
 
+# Tag (e.g., [Data 1]) that starts a numerical section in a HAXPES data file
+DATA_TAG = re.compile(rb"\[(Data|DATA)[^\]]*\]")
+
 
 # Function to read HAXPES data from a file
 # Extracts metadata and numerical data for further analysis
 def read_haxpes_data(filename_data, fermi_energy=None):
-    tag = None
     vmeta = {}  # Dictionary to store metadata
     vdata = {}  # Dictionary to store numerical data
-    with open(filename_data, "r") as f:
-        for line in f:
-            # Detect tags (e.g., [Data]) to categorize sections in the file
-            m = re.search(r"\[(Data|DATA).*\]", line)
-            if m:
-                tag = m.group(0)[1:-1]
-
-            if tag is None:
-                # Parse metadata lines in the format key=value
-                sline = line.split("=")
-                if len(sline) == 2:
-                    key = sline[0].strip()
-                    val = sline[1].strip()
-                    vmeta[key] = val
-            else:
-                # Parse numerical data within the tagged sections
-                sline = line.split()
-                if not m and len(sline) == 2:
-                    v1 = float(sline[0])
-                    v2 = float(sline[1])
-                    if tag not in vdata:
-                        vdata[tag] = []
-                    else:
-                        # Adjust data if Fermi energy is provided
-                        if fermi_energy:
-                            vdata[tag].append((fermi_energy - v1, v2))
-                        else:
-                            vdata[tag].append((v1, v2))
-        return vmeta, vdata
+    # Map the file into memory and scan it as bytes (no per-line decoding)
+    with open(filename_data, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as buf:
+        # Detect tags (e.g., [Data]) that start the numerical sections in the file
+        tags = list(DATA_TAG.finditer(buf))
+        header_end = tags[0].start() if tags else len(buf)
+
+        # Parse metadata lines in the format key=value
+        for line in buf[:header_end].decode().splitlines():
+            sline = line.split("=")
+            if len(sline) == 2:
+                key = sline[0].strip()
+                val = sline[1].strip()
+                vmeta[key] = val
+
+        # Parse numerical data within each tagged section as an (N, 2) array
+        for m, m_next in zip(tags, tags[1:] + [None]):
+            section = buf[m.end() : m_next.start() if m_next else len(buf)]
+            data = np.loadtxt(io.BytesIO(section), ndmin=2)
+            # Adjust data if Fermi energy is provided
+            if fermi_energy:
+                data[:, 0] = fermi_energy - data[:, 0]
+            vdata[m.group(0)[1:-1].decode()] = data
+    return vmeta, vdata
 
 
 # Function to normalize data and apply energy offset
@@ -118,21 +113,15 @@ def get_normalized_data(filename, fermi_energy, energy_offset=0.0, upper_limit=N
     # Read the data and extract key information
     vmeta, vdata = read_haxpes_data(filename, fermi_energy)
     key = list(vdata.keys())[0]
-    datalist = vdata[key]
-
-    xarray = []
-    yarray = []
+    data = vdata[key]
 
-    # Process and normalize the data
-    for data in datalist:
-        if upper_limit and data[0] > upper_limit:
-            continue
-        xarray.append(data[0] - energy_offset)
-        yarray.append(data[1])
+    # Drop points above the upper limit and apply the energy offset
+    if upper_limit:
+        data = data[data[:, 0] <= upper_limit]
+    xarray = data[:, 0] - energy_offset
 
     # Normalize the intensity values to max = 1
-    ymax = np.amax(yarray)
-    yarray /= ymax
+    yarray = data[:, 1] / np.amax(data[:, 1])
 
     return xarray, yarray
 
@@ -141,22 +130,19 @@ def get_normalized_data(filename, fermi_energy, energy_offset=0.0, upper_limit=N
 def get_leading_energy_at_y_interpolate(
     xarray, yarray, y_interpolate_min, y_interpolate_max, y_interpolate
 ):
-    xarray_sub = []
-    yarray_sub = []
-
-    # Extract the subset of data for interpolation
-    for i in range(len(xarray))[::-1]:
-        x = xarray[i]
-        y = yarray[i]
-        if y > y_interpolate_min:
-            xarray_sub.append(x)
-            yarray_sub.append(y)
-        if y > y_interpolate_max:
-            break
-
-    # Perform linear interpolation
-    f = interpolate.interp1d(yarray_sub, xarray_sub, kind="linear")
-    value = f([y_interpolate])[0]
+    # Extract the subset of data for interpolation: walk from the end of the arrays
+    # up to (and including) the first point above y_interpolate_max
+    xarray_rev = xarray[::-1]
+    yarray_rev = yarray[::-1]
+    above_max = np.flatnonzero(yarray_rev > y_interpolate_max)
+    stop = above_max[0] + 1 if above_max.size else len(yarray_rev)
+    mask = yarray_rev[:stop] > y_interpolate_min
+    xarray_sub = xarray_rev[:stop][mask]
+    yarray_sub = yarray_rev[:stop][mask]
+
+    # Perform linear interpolation (np.interp requires increasing sample points)
+    order = np.argsort(yarray_sub)
+    value = np.interp(y_interpolate, yarray_sub[order], xarray_sub[order])
     return value
 
 
@@ -200,10 +186,6 @@ y_interpolate_max = 0.75
 x_min, x_max = 1.5, -1.0
 y_min, y_max = -0.1, 1.2
 
-# Create a constant y array for the interpolated line
-xarray_int = xarray_ref
-yarray_int = [y_interpolate] * len(xarray_int)
-
 # Calculate energy offsets using interpolation
 leading_energy_target = get_leading_energy_at_y_interpolate(
     xarray, yarray, y_interpolate_min, y_interpolate_max, y_interpolate
@@ -223,40 +205,41 @@ print(f"... energy offset = {energy_offset:g}")
 xarray_corr = xarray + energy_offset
 
 # Plot settings and visualization
-figsize = (8, 6)
-fig = plt.figure(figsize=figsize)
-axis = plt.subplot(111)
+fig, ax = plt.subplots()  # Figure size from rcParams (8 x 6 inches)
 
-plt.plot(
+ax.plot(
     xarray_ref,
     yarray_ref,
     label=r"$\mathrm{Reference \,\, [10V]}$",
     color="red",
     linestyle="-",
     alpha=0.7,
+    rasterized=True,
 )
 
-plt.plot(
+ax.plot(
     xarray,
     yarray,
     label=r"$\mathrm{Target \,\, [TEC36F52]}$",
     color="black",
     linestyle="-",
     alpha=0.7,
+    rasterized=True,
 )
 
-plt.plot(
+ax.plot(
     xarray_corr,
     yarray,
     label=rf"$\mathrm{{Target \,\, with \,\, Energy \,\, corr. \,\, ({energy_offset:.2g} \,\, eV)}}$",
     color="black",
     linestyle="--",
     alpha=0.7,
+    rasterized=True,
 )
 
-plt.plot(
-    xarray_int,
-    yarray_int,
+# Horizontal line at the interpolation level
+ax.axhline(
+    y_interpolate,
     label=r"$\mathrm{Interpolated \, \, Line \,\, (0.4)}$",
     color="green",
     linestyle=":",
@@ -265,38 +248,40 @@ plt.plot(
 )
 
 # Customize plot appearance
-plt.xlabel(r"$\mathrm{Binding \,\, energy} \,\, (\mathrm{eV})$")
-plt.ylabel(r"$\mathrm{Intensity} \,\, (\mathrm{a.u.})$", labelpad=10)
+ax.set_xlabel(r"$\mathrm{Binding \,\, energy} \,\, (\mathrm{eV})$")
+ax.set_ylabel(r"$\mathrm{Intensity} \,\, (\mathrm{a.u.})$", labelpad=10)
 
-plt.gca().invert_xaxis()  # Reverse x-axis for conventional display
-plt.gca().yaxis.set_ticks_position("left")
-plt.gca().xaxis.set_ticks_position("both")
-plt.tick_params(axis="both", which="major")
-yticks = plt.gca().get_yticks()
-plt.gca().set_yticks(yticks)
-plt.grid(axis="x", linestyle="--", alpha=0.7)
+ax.invert_xaxis()  # Reverse x-axis for conventional display
+ax.yaxis.set_ticks_position("left")
+ax.xaxis.set_ticks_position("both")
+ax.tick_params(axis="both", which="major")
+yticks = ax.get_yticks()
+ax.set_yticks(yticks)
+ax.grid(axis="x", linestyle="--", alpha=0.7)
 
 # Set axis limits
-plt.xlim(x_min, x_max)
-plt.ylim(y_min, y_max)
+ax.set_xlim(x_min, x_max)
+ax.set_ylim(y_min, y_max)
 
 # Add a label for the valence band
-plt.text(
+ax.text(
     0.70,
     0.93,
     r"$\mathrm{Valence \,\, band}$",
     ha="left",
-    transform=plt.gca().transAxes,
+    transform=ax.transAxes,
 )
 
 # Add legend for clarity
-plt.legend(loc="lower left", bbox_to_anchor=(0.01, 0.05))
+ax.legend(loc="lower left", bbox_to_anchor=(0.01, 0.05))
 
-plt.tight_layout()
+fig.tight_layout()
 
 # Display and save the plot
 output_file_path = "./figures/haxpes_energy_calibration.png"
 print(f"The plot will be saved to: {output_file_path}")
-plt.savefig(output_file_path)
+fig.savefig(output_file_path)
 
-plt.show()
+if SHOW_PLOTS:
+    plt.show()
+plt.close(fig)
@@ -19,9 +19,11 @@ to highlight the normalized intensity variations with respect to binding energy.
 Overview:
 - Reads experimental data from CSV files containing binding energy (in eV) and intensity 
   values (arbitrary units).
-- Excludes metadata lines starting with '#' during preprocessing.
+- Excludes metadata lines starting with '#' while parsing (pandas C parser).
 - Applies Shirley background correction for baseline adjustment.
 - Normalizes intensity values to enable comparative analysis across samples.
+- Caches the processed spectra next to the data files ('<name>.shirley.npz'); the cache
+  is refreshed when a data file, the energy range or the processing code changes.
 
 Plot Features:
 - Binding energy (x-axis) is plotted in reverse order to emphasize the 
@@ -51,25 +53,41 @@ Output:
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib import rcParams
 import warnings
 
+from data_io import cached_arrays
+from plot_style import FIG_DPI, SHOW_PLOTS, apply_mdpi_style, even_tick_labels
+
 # Plot settings for MDPI style
-rcParams.update(
+apply_mdpi_style(
     {
-        "font.family": "serif",
-        "mathtext.fontset": "stix",  # Use STIX fonts for math
         "font.size": 18,
         "axes.titlesize": 18,
         "axes.labelsize": 18,
         "xtick.labelsize": 14,
         "ytick.labelsize": 14,
         "legend.fontsize": 12,
-        "figure.figsize": (8, 6),
     }
 )
 
 
+# Function to find the index of the point closest to a value in a monotonic array
+def nearest_index(x, value):
+    # Binary search on the array in ascending order
+    descending = x[0] > x[-1]
+    x_sorted = x[::-1] if descending else x
+    right = min(max(np.searchsorted(x_sorted, value), 1), len(x_sorted) - 1)
+    left = right - 1
+
+    # Pick the closer neighbor (on a tie, the one that comes first in x)
+    d_left = abs(value - x_sorted[left])
+    d_right = abs(x_sorted[right] - value)
+    if descending:
+        idx = right if d_right <= d_left else left
+        return len(x) - 1 - idx
+    return left if d_left <= d_right else right
+
+
 # Function to apply Shirley background correction with iterative convergence
 def shirley_background_correction(
     binding_energy, intensity, x_min, x_max, eps=1e-7, max_iters=50
@@ -78,9 +96,9 @@ def shirley_background_correction(
     binding_energy = np.array(binding_energy)
     intensity = np.array(intensity)
 
-    # Identify the indices for x_min and x_max
-    idx_min = np.argmin(np.abs(binding_energy - x_min))
-    idx_max = np.argmin(np.abs(binding_energy - x_max))
+    # Identify the indices for x_min and x_max (binding energy is sampled monotonically)
+    idx_min = nearest_index(binding_energy, x_min)
+    idx_max = nearest_index(binding_energy, x_max)
 
     # Ensure idx_min < idx_max
     if idx_min > idx_max:
@@ -93,29 +111,38 @@ def shirley_background_correction(
     i_left = intensity[idx_min]
     i_right = intensity[idx_max]
 
+    # The cumulative intensity and the scale factor do not change between iterations
+    cumulative_intensity = np.cumsum(intensity)
+    k = (i_left - i_right) / (
+        cumulative_intensity[idx_min] - cumulative_intensity[idx_max]
+    )
+    # Part of the update that depends only on the intensity:
+    # new_bg = i_right + k * (cumulative_intensity[idx_min] - cumulative_intensity)
+    #          + k * (cumulative_bg - cumulative_bg[idx_min])
+    intensity_term = i_right + k * (
+        cumulative_intensity[idx_min] - cumulative_intensity
+    )
+
+    # Work arrays reused by every iteration (no allocations inside the loop)
+    cumulative_bg = np.empty_like(bg)
+    new_bg = np.empty_like(bg)
+    diff = np.empty_like(bg)
+
     # Iterative calculation of the Shirley background
     for iter_count in range(max_iters):
-        cumulative_bg = np.cumsum(bg)
-        cumulative_intensity = np.cumsum(intensity)
+        np.cumsum(bg, out=cumulative_bg)
 
-        new_bg = np.zeros_like(bg)
-        k = (i_left - i_right) / (
-            cumulative_intensity[idx_min] - cumulative_intensity[idx_max]
-        )
-
-        for i in range(len(binding_energy)):
-            new_bg[i] = i_right + k * (
-                cumulative_intensity[idx_min]
-                - cumulative_intensity[i]
-                - cumulative_bg[idx_min]
-                + cumulative_bg[i]
-            )
+        # new_bg = intensity_term + k * (cumulative_bg - cumulative_bg[idx_min])
+        np.subtract(cumulative_bg, cumulative_bg[idx_min], out=new_bg)
+        new_bg *= k
+        new_bg += intensity_term
 
         # Check for convergence
-        if np.max(np.abs(new_bg - bg)) < eps:
+        np.subtract(new_bg, bg, out=diff)
+        if np.abs(diff, out=diff).max() < eps:
             break
 
-        bg = new_bg
+        bg, new_bg = new_bg, bg
 
     if (iter_count + 1) == max_iters:
         warnings.warn(
@@ -130,6 +157,29 @@ def shirley_background_correction(
     return corrected_intensity
 
 
+# Function to read a spectrum, apply the Shirley background correction and normalize it
+def process_spectrum(file_path, x_min, x_max):
+    # Load the data, skipping metadata lines (starting with '#') and blank lines
+    data = pd.read_csv(
+        file_path,
+        comment="#",
+        header=None,
+        names=["Binding energy", "Intensity"],
+        dtype=np.float64,
+    )
+    binding_energy = data["Binding energy"].to_numpy()
+
+    # Apply Shirley background correction
+    corrected_intensity = shirley_background_correction(
+        binding_energy, data["Intensity"].to_numpy(), x_min, x_max
+    )
+
+    # Normalize the intensity by the peak value
+    normalized_intensity = corrected_intensity / corrected_intensity.max()
+
+    return binding_energy, normalized_intensity
+
+
 # File path list
 file_path_list = [
     "./data/haxpes_Pt4f_TEC10F50E_H_0001.csv",
@@ -154,37 +204,32 @@ title = r"$\mathrm{Pt \,\, 4f}$"
 x_min, x_max = 78, 68  # Set the x-axis range
 y_min, y_max = -0.1, 1.3  # Set the y-axis range
 
-plt.figure(figsize=(8, 6))  # Increase figure size for better readability
+plt.figure()  # Figure size from rcParams (8 x 6 inches)
 
-# Loop through each file and plot
-for file_path, legend, color in zip(file_path_list, legends, colors):
+# Process all spectra first (reading, correction and normalization are independent
+# of plotting), then plot them. The processed spectra are cached next to the data
+# files, so repeated runs skip the parsing and the Shirley iterations.
+spectra = []
+for file_path in file_path_list:
     print(f"Reading data from: {file_path}")
-    with open(file_path, "r") as file:
-        lines = file.readlines()
-
-    # Filter out metadata lines (starting with '#')
-    data_lines = [line for line in lines if not line.startswith("#") and line.strip()]
-
-    # Convert data lines to a DataFrame
-    data = pd.DataFrame(
-        [list(map(float, line.split(","))) for line in data_lines],
-        columns=["Binding energy", "Intensity"],
-    )
-
-    # Apply Shirley background correction
-    data["Corrected Intensity"] = shirley_background_correction(
-        data["Binding energy"].to_numpy(), data["Intensity"].to_numpy(), x_min, x_max
-    )
-
-    # Normalize the intensity by the peak value
-    data["Normalized Intensity"] = (
-        data["Corrected Intensity"] / data["Corrected Intensity"].max()
+    spectra.append(
+        cached_arrays(
+            file_path,
+            "shirley",
+            (x_min, x_max),
+            lambda file_path=file_path: process_spectrum(file_path, x_min, x_max),
+            (process_spectrum, shirley_background_correction, nearest_index),
+        )
     )
 
+# Loop through each spectrum and plot
+for (binding_energy, normalized_intensity), legend, color in zip(
+    spectra, legends, colors
+):
     # Plot the data with adjusted transparency and line width
     plt.plot(
-        data["Binding energy"],
-        data["Normalized Intensity"],
+        binding_energy,
+        normalized_intensity,
         label=legend,
         color=color,
         linewidth=1.5,
@@ -206,7 +251,7 @@ plt.tick_params(axis="both", which="major")
 plt.grid(axis="x", linestyle="--", alpha=0.7)
 
 all_ticks = np.arange(x_min, x_max - 1, -1)
-labels = [str(tick) if tick % 2 == 0 else "" for tick in all_ticks]
+labels = even_tick_labels(all_ticks)
 plt.gca().set_xticks(all_ticks)
 plt.gca().set_xticklabels(labels)
 
@@ -224,5 +269,6 @@ output_file_path = "./figures/haxpes_pt4f.png"
 print(f"The plot will be saved to: {output_file_path}")
 
 # Save the plot as a PNG file
-plt.savefig(output_file_path, dpi=300)
-plt.show()
+plt.savefig(output_file_path, dpi=FIG_DPI)
+if SHOW_PLOTS:
+    plt.show()
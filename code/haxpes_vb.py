@@ -47,23 +47,40 @@ Dependencies:
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib import rcParams
+
+from plot_style import FIG_DPI, SHOW_PLOTS, apply_mdpi_style, even_tick_labels
 
 # Set font style for MDPI article format
-rcParams.update(
+apply_mdpi_style(
     {
-        "font.family": "serif",  # Use a serif font like Times New Roman
-        "mathtext.fontset": "stix",  # Use STIX fonts for math
         "font.size": 18,  # Adjust font size to MDPI recommendations
         "axes.titlesize": 18,  # Larger title size
         "axes.labelsize": 18,  # Axis label size
         "xtick.labelsize": 14,  # X-axis tick label size
         "ytick.labelsize": 14,  # Y-axis tick label size
         "legend.fontsize": 12,  # Legend font size
-        "figure.figsize": (8, 6),  # Default figure size
     }
 )
 
+
+# Function to read a spectrum and normalize its intensity
+def read_spectrum(file_path):
+    print(f"Reading data from: {file_path}")
+
+    # Load the data, skipping metadata lines (starting with '#') and blank lines
+    data = pd.read_csv(
+        file_path,
+        comment="#",
+        header=None,
+        names=["Binding energy", "Intensity"],
+        dtype=np.float64,
+    )
+    intensity = data["Intensity"].to_numpy()
+
+    # Normalize the intensity by the peak value
+    return data["Binding energy"].to_numpy(), intensity / intensity.max()
+
+
 # File path list
 file_path_list = [
     "./data/haxpes_VB_TEC10F50E_H_0001.csv",
@@ -87,30 +104,17 @@ title = r"$\mathrm{Valence \,\, band}$"
 x_min, x_max = 14, -1  # Set the x-axis range
 y_min, y_max = -0.1, 1.2  # Set the y-axis range
 
-plt.figure(figsize=(8, 6))  # Increase figure size for better readability
-
-# Loop through each file and plot
-for file_path, legend, color in zip(file_path_list, legends, colors):
-    print(f"Reading data from: {file_path}")
-    with open(file_path, "r") as file:
-        lines = file.readlines()
-
-    # Filter out metadata lines (starting with '#')
-    data_lines = [line for line in lines if not line.startswith("#") and line.strip()]
+plt.figure()  # Figure size from rcParams (8 x 6 inches)
 
-    # Convert data lines to a DataFrame
-    data = pd.DataFrame(
-        [list(map(float, line.split(","))) for line in data_lines],
-        columns=["Binding energy", "Intensity"],
-    )
-
-    # Normalize the intensity by the peak value
-    data["Intensity"] /= data["Intensity"].max()
+# Read all spectra first, then plot them
+spectra = [read_spectrum(file_path) for file_path in file_path_list]
 
+# Loop through each spectrum and plot
+for (binding_energy, intensity), legend, color in zip(spectra, legends, colors):
     # Plot the data with adjusted transparency and line width
     plt.plot(
-        data["Binding energy"],
-        data["Intensity"],
+        binding_energy,
+        intensity,
         label=legend,
         color=color,
         linewidth=1.5,
@@ -134,9 +138,7 @@ plt.grid(axis="x", linestyle="--", alpha=0.7)
 
 # Adjust x-axis tick interval
 all_ticks = np.arange(x_min, x_max - 1, -1)  # Generate ticks every 1 unit
-labels = [
-    str(tick) if tick % 2 == 0 else "" for tick in all_ticks
-]  # Show label for every 2nd tick
+labels = even_tick_labels(all_ticks)  # Show label for every 2nd tick
 plt.gca().set_xticks(all_ticks)  # Apply the new tick positions
 plt.gca().set_xticklabels(labels)  # Apply the new tick labels
 
@@ -156,6 +158,7 @@ output_file_path = "./figures/haxpes_vb.png"
 print(f"The plot will be saved to: {output_file_path}")
 
 # Save the plot as a PNG file
-plt.savefig(output_file_path, dpi=300)
+plt.savefig(output_file_path, dpi=FIG_DPI)
 
-plt.show()
+if SHOW_PLOTS:
+    plt.show()
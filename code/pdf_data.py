@@ -32,38 +32,38 @@ Output:
 Dependencies:
 - pandas: For loading and processing Excel data.
 - matplotlib: For generating and customizing plots.
+- openpyxl: For reading the Excel file.
 """
 
 import pandas as pd
 import matplotlib.pyplot as plt
-from matplotlib import rcParams
 import numpy as np
 
+from plot_style import FIG_DPI, SHOW_PLOTS, apply_mdpi_style
+
 # Update matplotlib settings to match the MDPI article format
-rcParams.update(
+apply_mdpi_style(
     {
-        "font.family": "serif",  # Set font family to serif for a professional appearance
-        "mathtext.fontset": "stix",  # Use STIX font for math expressions
         "font.size": 10,  # General font size
         "axes.titlesize": 18,  # Title font size for axes
         "axes.labelsize": 18,  # Label font size for axes
         "xtick.labelsize": 14,  # Font size for x-axis ticks
         "ytick.labelsize": 14,  # Font size for y-axis ticks
         "legend.fontsize": 14,  # Font size for legend text
-        "figure.figsize": (8, 6),  # Default figure size
     }
 )
 
 # Load the Excel file containing the data
 file_path = "./data/pdf_data.xlsx"
 
-# Read data from specific sheets into separate DataFrames
-corrected_data = pd.read_excel(file_path, sheet_name="corrected_data")  # Corrected data
-raw_data = pd.read_excel(file_path, sheet_name="raw_data")  # Raw data
-background_data = pd.read_excel(file_path, sheet_name="quartz_cap")  # Background data
+# Read data from specific sheets into separate DataFrames (opening the workbook once)
+with pd.ExcelFile(file_path, engine="openpyxl") as xl:
+    corrected_data = xl.parse("corrected_data")  # Corrected data
+    raw_data = xl.parse("raw_data")  # Raw data
+    background_data = xl.parse("quartz_cap")  # Background data
 
 # Initialize the plot
-plt.figure(figsize=(8, 6))  # Create a new figure with specified dimensions
+plt.figure()  # Figure size from rcParams (8 x 6 inches)
 
 
 # Define a function to process and plot concatenated data from multiple columns
@@ -81,8 +81,8 @@ def plot_concatenated_data(
     - scale_factors: Scaling factors to adjust the intensity.
     - offset_factors: Offset factors to adjust the baseline of the intensity.
     """
-    combined_twotheta = []  # List for concatenated 2θ values
-    combined_count = []  # List for concatenated intensity values
+    twotheta_parts = []  # 2θ values of each dataset
+    count_parts = []  # Intensity values of each dataset
 
     # Iterate through columns for Twotheta and Count
     for i in range(1, 8):
@@ -90,84 +90,113 @@ def plot_concatenated_data(
         col_count = f"Count{i}/I0"  # Name of the intensity column
 
         if col_twotheta in data.columns and col_count in data.columns:
-            # Filter data based on the specified x_range
-            data_filtered = data[
-                (data[col_twotheta] >= x_range[i][0])
-                & (data[col_twotheta] <= x_range[i][1])
-            ]
+            twotheta = data[col_twotheta].to_numpy()
+            count = data[col_count].to_numpy()
+
+            # Keep the data within the specified x_range (2θ is sorted in each column)
+            start = np.searchsorted(twotheta, x_range[i][0], side="left")
+            stop = np.searchsorted(twotheta, x_range[i][1], side="right")
 
             # Scale and offset the intensity values
-            scaled_count = (
-                data_filtered[col_count] * scale_factors[i] + offset_factors[i]
-            )
-            combined_twotheta.extend(data_filtered[col_twotheta])  # Append 2θ values
-            combined_count.extend(scaled_count)  # Append intensity values
+            twotheta_parts.append(twotheta[start:stop])
+            count_parts.append(count[start:stop] * scale_factors[i] + offset_factors[i])
 
     # Combine and sort the data for smooth plotting
-    combined_data = pd.DataFrame(
-        {"Twotheta": combined_twotheta, "Count": combined_count}
-    )
-    combined_data = combined_data.sort_values(by="Twotheta")  # Sort by 2θ
+    combined_twotheta = np.concatenate(twotheta_parts)
+    combined_count = np.concatenate(count_parts)
+    order = np.argsort(combined_twotheta, kind="stable")  # Sort by 2θ
 
     # Plot the concatenated data
     plt.plot(
-        combined_data["Twotheta"],
-        combined_data["Count"],
+        combined_twotheta[order],
+        combined_count[order],
         label=label_prefix,
         color=color,
         alpha=0.7,
     )
 
 
-# Initialize scaling and offset factors, and x-axis ranges for data continuity
-scale_factors = [1.0] * 8
-offset_bkg_factors = [0.0] * 8
-x_range = [[0.0, 0.0]] * 8
-
-# Calculate scaling factors and x-axis ranges
-for i in range(1, 8):
-    # Default range for overlaps
-    overlap_start = 0.0
-    overlap_end = 60.0
-    x_range[i] = [overlap_start, overlap_end]
-
-    if i >= 2:
-        # Adjust the range for overlaps based on neighboring datasets
-        overlap_start = 0.5 * (
-            raw_data[f"Twotheta{i-1}"].max() + raw_data[f"Twotheta{i}"].min()
-        )
-    if i <= 6:
-        overlap_end = 0.5 * (
-            raw_data[f"Twotheta{i}"].max() + raw_data[f"Twotheta{i+1}"].min()
-        )
-
-    if i >= 2 and overlap_start < overlap_end:
-        # Calculate scaling factors for continuity between datasets
-        count1_interp = np.interp(
-            overlap_start, raw_data[f"Twotheta{i-1}"], raw_data[f"Count{i-1}/I0"]
-        )
-        count2_interp = np.interp(
-            overlap_start, raw_data[f"Twotheta{i}"], raw_data[f"Count{i}/I0"]
-        )
-        scale_factors[i] = scale_factors[i - 1] * count1_interp / count2_interp
-        x_range[i] = [overlap_start, overlap_end]
-
-        # Calculate offset factor for background data
-        count1_bkg_interp = np.interp(
-            overlap_start,
-            background_data[f"Twotheta{i-1}"],
-            background_data[f"Count{i-1}/I0"],
-        )
-        count2_bkg_interp = np.interp(
-            overlap_start,
-            background_data[f"Twotheta{i}"],
-            background_data[f"Count{i}/I0"],
-        )
-        offset_bkg_factors[i] = (
-            offset_bkg_factors[i - 1]
-            + scale_factors[i - 1] * count1_bkg_interp
-            - scale_factors[i] * count2_bkg_interp
-        )
+# Define a function to interpolate linearly at one point of a sorted dataset
+def interp_at(x, xp, fp):
+    """
+    Interpolate fp(xp) linearly at a single point (same result as np.interp).
+
+    Parameters:
+    - x: Point at which the intensity is interpolated.
+    - xp: 2θ values of the dataset (sorted in ascending order).
+    - fp: Intensities of the dataset.
+
+    Returns:
+    - Interpolated intensity (the end values outside the 2θ range).
+    """
+    # Binary search for the interval containing x, clamped to the first/last interval
+    j = min(max(np.searchsorted(xp, x), 1), len(xp) - 1)
+    t = min(max((x - xp[j - 1]) / (xp[j] - xp[j - 1]), 0.0), 1.0)
+    return fp[j - 1] + t * (fp[j] - fp[j - 1])
+
+
+# Define a function to interpolate neighboring datasets at their overlap points
+def interp_at_overlaps(data, overlap_points):
+    """
+    Interpolate the intensities of both neighboring datasets at each overlap point.
+
+    Parameters:
+    - data: DataFrame containing the dataset.
+    - overlap_points: 2θ values between dataset i and i + 1 (i = 1, ..., 6).
+
+    Returns:
+    - Intensities of the lower (i) and upper (i + 1) datasets at the overlap points.
+    """
+    # 2θ and intensity arrays of each dataset, extracted once (datasets 2-6 are used
+    # for both the lower and the upper side)
+    columns = [
+        (data[f"Twotheta{i}"].to_numpy(), data[f"Count{i}/I0"].to_numpy())
+        for i in range(1, len(overlap_points) + 2)
+    ]
+
+    lower = np.array([interp_at(x, *columns[i]) for i, x in enumerate(overlap_points)])
+    upper = np.array(
+        [interp_at(x, *columns[i + 1]) for i, x in enumerate(overlap_points)]
+    )
+    return lower, upper
+
+
+# Midpoints of the overlaps between neighboring datasets (boundaries of datasets 2-7)
+# (the 2θ columns are converted to one array, then reduced column by column)
+twotheta_columns = raw_data[[f"Twotheta{i}" for i in range(1, 8)]].to_numpy()
+twotheta_min = np.nanmin(twotheta_columns, axis=0)
+twotheta_max = np.nanmax(twotheta_columns, axis=0)
+overlap_points = 0.5 * (twotheta_max[:-1] + twotheta_min[1:])
+
+# The datasets must follow each other in 2θ so that each range is non-empty
+if not np.all(np.diff(np.append(overlap_points, 60.0)) > 0):
+    raise ValueError("The 2θ ranges of the datasets must increase from 1 to 7")
+
+# x-axis ranges for data continuity (index 0 is unused; dataset 1 is not cut)
+x_range = [[0.0, 0.0], [0.0, 60.0]] + [
+    [overlap_start, overlap_end]
+    for overlap_start, overlap_end in zip(
+        overlap_points, np.append(overlap_points[1:], 60.0)
+    )
+]
+
+# Scaling factors for continuity between datasets (relative to dataset 1)
+count1_interp, count2_interp = interp_at_overlaps(raw_data, overlap_points)
+scale_factors = np.concatenate(([1.0, 1.0], np.cumprod(count1_interp / count2_interp)))
+
+# Offset factors for background data
+count1_bkg_interp, count2_bkg_interp = interp_at_overlaps(
+    background_data, overlap_points
+)
+offset_bkg_factors = np.concatenate(
+    (
+        [0.0, 0.0],
+        np.cumsum(
+            scale_factors[1:-1] * count1_bkg_interp
+            - scale_factors[2:] * count2_bkg_interp
+        ),
+    )
+)
 
 # Plot raw, background, and corrected data
 plot_concatenated_data(
@@ -198,5 +227,6 @@ plt.tight_layout()
 # Save the plot to a file
 output_file_path = "./figures/pdf_data.png"
 print(f"The plot will be saved to: {output_file_path}")
-plt.savefig(output_file_path, dpi=300)
-plt.show()
+plt.savefig(output_file_path, dpi=FIG_DPI)
+if SHOW_PLOTS:
+    plt.show()
@@ -34,21 +34,18 @@ Dependencies:
 import pandas as pd
 import matplotlib.pyplot as plt
 
-from matplotlib import rcParams
+from plot_style import FIG_DPI, SHOW_PLOTS, apply_mdpi_style
 
 # Set font style for MDPI article format
 
-rcParams.update(
+apply_mdpi_style(
     {
-        "font.family": "serif",  # Use a serif font such as Times New Roman
-        "mathtext.fontset": "stix",  # Use STIX fonts for math text
         "font.size": 10,  # General font size
         "axes.titlesize": 18,  # Font size for axis titles
         "axes.labelsize": 18,  # Font size for axis labels
         "xtick.labelsize": 14,  # Font size for x-axis tick labels
         "ytick.labelsize": 14,  # Font size for y-axis tick labels
         "legend.fontsize": 20,  # Font size for the legend
-        "figure.figsize": (8, 6),  # Default figure size (width, height in inches)
     }
 )
 
@@ -58,14 +55,23 @@ print(f"Reading data from: {file_path}")
 
 # Load the data
 # Read from the 3rd line onwards
-data = pd.read_csv(file_path, sep=r"\s+", skiprows=2, header=None)
+# (whitespace-separated; only the first two columns are parsed, with the C parser)
+data = pd.read_csv(
+    file_path,
+    sep=r"\s+",
+    skiprows=2,
+    header=None,
+    usecols=[0, 1],
+    dtype="float64",
+    engine="c",
+)
 
-# Extract the required columns
-Q = data.iloc[:, 0]
-S_Q = data.iloc[:, 1]
+# Extract the required columns as NumPy views (no pandas Series in the plot calls)
+arr = data.to_numpy()
+Q, S_Q = arr[:, 0], arr[:, 1]
 
 # Create the plot
-plt.figure(figsize=(8, 6))
+plt.figure()  # Figure size from rcParams (8 x 6 inches)
 plt.plot(Q, S_Q, "k-", label=r"$\mathrm{TEC10V30E}$", linewidth=2)
 
 plt.xlabel(r"$Q \,\, (\mathrm{\AA}^{-1})$")
@@ -85,7 +91,8 @@ output_file_path = "./figures/pdf_sq.png"
 print(f"The plot will be saved to: {output_file_path}")
 
 # Save the plot as a PNG file
-plt.savefig(output_file_path, dpi=300)
+plt.savefig(output_file_path, dpi=FIG_DPI)
 
 # Display the plot
-plt.show()
+if SHOW_PLOTS:
+    plt.show()
@@ -56,43 +56,74 @@ This script performs peak fitting for the total radial distribution function T(r
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-from matplotlib import rcParams
 from scipy.optimize import least_squares
 from scipy.signal import find_peaks
 
-# Set font style
+from plot_style import FIG_DPI, SHOW_PLOTS, apply_mdpi_style
 
-rcParams.update(
+# Set font style
+apply_mdpi_style(
     {
-        "font.family": "serif",  # Use a serif font such as Times New Roman
-        "mathtext.fontset": "stix",  # Use STIX fonts for math text
         "font.size": 10,  # General font size
         "axes.titlesize": 18,  # Font size for axis titles
         "axes.labelsize": 18,  # Font size for axis labels
         "xtick.labelsize": 14,  # Font size for x-axis tick labels
         "ytick.labelsize": 14,  # Font size for y-axis tick labels
         "legend.fontsize": 12,  # Font size for the legend
-        "figure.figsize": (8, 6),  # Default figure size (width, height in inches)
     }
 )
 
 
 # Function for Ax^n exp(-lambda x)
+# (evaluated as one exponential, exp(n ln x - lambda x); x is clamped to the smallest
+# positive float so that x = 0 gives 0 instead of NaN)
 def additional_term(x, A, n, lambda_):
-    return A * x**n * np.exp(-lambda_ * x)
+    log_x = np.log(np.maximum(x, np.finfo(float).tiny))
+    return A * np.exp(n * log_x - lambda_ * x)
+
+
+# Terms of the model for the last evaluated grid and parameters. The grid terms
+# (4 pi x, ln x) are computed once per grid x. least_squares evaluates the Jacobian
+# at the same parameters as the preceding residuals, so the exponentials are
+# computed only once per fit step.
+_terms_cache = {}
+
+
+# Function to evaluate the terms of the model (cached for the last grid and parameters)
+def model_terms(x, params):
+    terms = _terms_cache
+    if terms.get("x") is not x:
+        terms.clear()
+        # ln x with x clamped to the smallest positive float, so that the power term
+        # and its n derivative are 0 instead of NaN at x = 0
+        log_x = np.log(np.maximum(x, np.finfo(float).tiny))
+        terms.update(x=x, four_pi_x=4 * np.pi * x, log_x=log_x)
+    elif np.array_equal(terms["params"], params):
+        return terms
+
+    # Amplitudes, centers and widths of all peaks, evaluated in one broadcast
+    # (rows: x, columns: peaks)
+    num_peaks = (len(params) - 4) // 3
+    _, x0, sigma = params[1 : 1 + 3 * num_peaks].reshape(num_peaks, 3).T
+    n, lambda_ = params[-2], params[-1]
+    dx = x[:, None] - x0
+    terms.update(
+        params=params.copy(),
+        dx=dx,
+        gaussians=np.exp(-(dx**2) / (2 * sigma**2)),  # Unit amplitude
+        power_exp=np.exp(n * terms["log_x"] - lambda_ * x),  # x^n exp(-lambda x)
+    )
+    return terms
 
 
 # Multi-Gaussian with baseline and additional term
 def multi_gaussian_with_baseline_and_additional(x, params):
-    rho = params[0]
-    num_peaks = (len(params) - 4) // 3
-    baseline = 4 * np.pi * x * rho
-    gaussians = sum(
-        params[i] * np.exp(-((x - params[i + 1]) ** 2) / (2 * params[i + 2] ** 2))
-        for i in range(1, 3 * num_peaks + 1, 3)
-    )
-    A, n, lambda_ = params[-3], params[-2], params[-1]
-    additional = additional_term(x, A, n, lambda_)
+    params = np.asarray(params, dtype=float)
+    terms = model_terms(x, params)
+    baseline = terms["four_pi_x"] * params[0]  # 4 pi x rho
+    # Sum of the peaks with amplitudes a
+    gaussians = terms["gaussians"] @ params[1:-3:3]
+    additional = params[-3] * terms["power_exp"]  # A x^n exp(-lambda x)
     return baseline + additional + gaussians, baseline + additional, gaussians
 
 
@@ -102,16 +133,50 @@ def residuals(params, x, y):
     return y - y_model
 
 
+# Jacobian of the residual function (analytic derivatives of the model)
+def jacobian(params, x, y):
+    params = np.asarray(params, dtype=float)
+    num_peaks = (len(params) - 4) // 3
+    a, _, sigma = params[1 : 1 + 3 * num_peaks].reshape(num_peaks, 3).T
+    A = params[-3]
+    terms = model_terms(x, params)
+    dx, gaussians, power_exp = terms["dx"], terms["gaussians"], terms["power_exp"]
+
+    # Columns in the order of params: rho, (a, x0, sigma) per peak, A, n, lambda
+    jac = np.empty((len(x), len(params)))
+    jac[:, 0] = terms["four_pi_x"]
+    jac[:, 1:-3:3] = gaussians
+    d_x0 = a * gaussians * (dx / sigma**2)
+    jac[:, 2:-3:3] = d_x0
+    jac[:, 3:-3:3] = d_x0 * (dx / sigma)
+    jac[:, -3] = power_exp
+    jac[:, -2] = A * power_exp * terms["log_x"]
+    jac[:, -1] = -A * x * power_exp
+
+    # The residuals are y - model
+    return -jac
+
+
 # Function to calculate area with y > 0 within ±3σ
-def calculate_area(x, y):
-    mask = y > 0
-    return np.trapezoid(y[mask], x[mask])
+# (spacing: precomputed grid spacings between the points of y)
+def calculate_area(spacing, y):
+    # Trapezoidal rule over the intervals whose end points are both positive. This
+    # equals the trapezoidal area of the positive points alone only while the positive
+    # region of the window is contiguous (as it is for these peaks): np.trapezoid on
+    # y[y > 0] would also bridge the gaps between separate positive regions
+    positive = (y[1:] > 0) & (y[:-1] > 0)
+    return float(spacing @ (0.5 * (y[1:] + y[:-1]) * positive))
 
 
 # Function to calculate standard errors
 def calculate_standard_errors(result):
-    jacobian = result.jac
-    cov_matrix = np.linalg.inv(jacobian.T @ jacobian)
+    # Covariance (J^T J)^-1 from the SVD J = U diag(s) V^T, without forming J^T J;
+    # directions with negligible singular values (rank deficiency) are discarded
+    _, s, Vt = np.linalg.svd(result.jac, full_matrices=False)
+    tol = max(result.jac.shape) * np.finfo(float).eps * s[0]
+    s_inv2 = np.zeros_like(s)
+    s_inv2[s > tol] = 1.0 / s[s > tol] ** 2
+    cov_matrix = (Vt.T * s_inv2) @ Vt
     errors = np.sqrt(np.diag(cov_matrix))
     return errors
 
@@ -150,31 +215,39 @@ peaks, _ = find_peaks(
 selected_peaks = x_valid[peaks]
 
 if len(selected_peaks) > peak_find_count_max:
-    selected_peaks = selected_peaks[np.argsort(y_valid[peaks])[-peak_find_count_max:]]
+    # Keep the highest peaks (partial selection; they are sorted by position below)
+    highest = np.argpartition(y_valid[peaks], -peak_find_count_max)
+    selected_peaks = selected_peaks[highest[-peak_find_count_max:]]
 selected_peaks = np.sort(selected_peaks)
 
-# Initialize parameters
-initial_params = [rho_initial]
-for peak in selected_peaks:
-    initial_params.extend([1.0, peak, 0.1])
-initial_params.extend([A_initial, n_initial, lambda_initial])
-
-# Define bounds
-lower_bounds = [-np.inf]
-upper_bounds = [np.inf]
-for peak in selected_peaks:
-    lower_bounds.extend([0, peak - 0.1, 0])
-    upper_bounds.extend([np.inf, peak + 0.1, np.inf])
-lower_bounds.extend([-np.inf, 0, 0])
-upper_bounds.extend([0, np.inf, np.inf])
+# Initialize parameters: rho, (a, x0, sigma) per peak, A, n, lambda
+num_params = 3 * len(selected_peaks) + 4
+initial_params = np.empty(num_params)
+initial_params[0] = rho_initial
+initial_params[1:-3:3] = 1.0
+initial_params[2:-3:3] = selected_peaks
+initial_params[3:-3:3] = 0.1
+initial_params[-3:] = [A_initial, n_initial, lambda_initial]
+
+# Define bounds (A < 0, n > 0, lambda > 0, peak centers within ±0.1 of the guess)
+lower_bounds = np.empty(num_params)
+upper_bounds = np.empty(num_params)
+lower_bounds[0], upper_bounds[0] = -np.inf, np.inf
+lower_bounds[1:-3:3], upper_bounds[1:-3:3] = 0, np.inf
+lower_bounds[2:-3:3], upper_bounds[2:-3:3] = selected_peaks - 0.1, selected_peaks + 0.1
+lower_bounds[3:-3:3], upper_bounds[3:-3:3] = 0, np.inf
+lower_bounds[-3:] = [-np.inf, 0, 0]
+upper_bounds[-3:] = [0, np.inf, np.inf]
 
 # Fit the data
 try:
     result = least_squares(
         residuals,
         initial_params,
+        jac=jacobian,
         args=(x, y),
         bounds=(lower_bounds, upper_bounds),
+        x_scale="jac",  # Scale the parameters by the column norms of the Jacobian
         max_nfev=20000,
     )
     params = result.x
@@ -196,29 +269,35 @@ try:
     )
     print(f"Fitted rho: {rho:.4f} ± {rho_err:.4f}")
 
+    # Baseline and additional term over the whole grid (sliced for each peak below)
+    y_baseline_full = 4 * np.pi * x * rho + additional_term(x, A, n, lambda_)
+
+    # Grid spacings for the trapezoidal rule (sliced for each peak below)
+    spacing_full = np.diff(x)
+
     # Calculate peak parameters, areas, and errors
     fitted_peaks = []
     for i in range(1, len(params) - 3, 3):
         a, x0, sigma = params[i : i + 3]
         a_err, x0_err, sigma_err = errors[i : i + 3]
 
-        # Define the range for the current peak
-        x_gaussian = x[(x >= x0 - 3 * sigma) & (x <= x0 + 3 * sigma)]
+        # Define the range for the current peak (x is sorted: binary search for ±3σ)
+        lo = np.searchsorted(x, x0 - 3 * sigma, side="left")
+        hi = np.searchsorted(x, x0 + 3 * sigma, side="right")
+        x_gaussian = x[lo:hi]
 
         # Calculate contribution of the specific gaussian
         y_gaussian = a * np.exp(-((x_gaussian - x0) ** 2) / (2 * sigma**2))
 
         # Include only the baseline and additional term
-        y_baseline = 4 * np.pi * x_gaussian * rho + additional_term(
-            x_gaussian, A, n, lambda_
-        )
-        y_combined = y_gaussian + y_baseline
+        y_combined = y_gaussian + y_baseline_full[lo:hi]
 
         # Clip to positive values only
         y_combined = y_combined.clip(min=0)
 
-        # Calculate the area under the peak
-        area = calculate_area(x_gaussian, y_combined)
+        # Calculate the area under the peak (the spacing slice is clamped so that an
+        # empty window, e.g. one entirely below x[0], gives an area of 0)
+        area = calculate_area(spacing_full[lo : max(hi - 1, lo)], y_combined)
         area_err = abs(a_err / a) * area  # Approximate error for area
 
         # Append results
@@ -232,7 +311,7 @@ try:
         )
 
     # Plot results with hatch regions
-    plt.figure(figsize=(8, 6))
+    plt.figure()  # Figure size from rcParams (8 x 6 inches)
     plt.plot(
         x,
         y,
@@ -242,12 +321,12 @@ try:
         alpha=0.8,
     )
 
-    x_range = np.linspace(min(x), max(x), 1000)
-    y_fitted, _, _ = multi_gaussian_with_baseline_and_additional(x_range, params)
+    # Fitted curve at the measured r values (the residuals of the fit are y - model)
+    y_fitted = y - result.fun
 
-    mask = x_range <= fit_curve_visible_x_max
+    mask = x <= fit_curve_visible_x_max
     plt.plot(
-        x_range[mask],
+        x[mask],
         y_fitted[mask],
         label=r"$\mathrm{Gaussian \,\, + \,\, Baseline \, Fit}$",
         color="red",
@@ -256,24 +335,30 @@ try:
         alpha=0.7,
     )
 
+    # Plotting grid for the hatched peak regions
+    x_range = np.linspace(min(x), max(x), 1000)
+
+    # Baseline and additional term, and the Gaussians of all peaks (one column per
+    # peak), evaluated once over the plotting grid and sliced for each peak below
+    terms_range = model_terms(x_range, params)
+    y_baseline_range = terms_range["four_pi_x"] * rho + A * terms_range["power_exp"]
+    y_gaussians_range = terms_range["gaussians"] * params[1:-3:3]
+
     for i, (x0, _, sigma, _, area, _) in enumerate(fitted_peaks):
-        # Define the range for the current peak
-        x_hatch = x_range[(x_range >= x0 - 3 * sigma) & (x_range <= x0 + 3 * sigma)]
+        if i >= peak_used_count:
+            break
 
-        # Calculate contribution of the specific gaussian
-        a = params[1 + 3 * i]
-        y_gaussian = a * np.exp(-((x_hatch - x0) ** 2) / (2 * sigma**2))
+        # Define the range for the current peak (x_range is sorted)
+        lo = np.searchsorted(x_range, x0 - 3 * sigma, side="left")
+        hi = np.searchsorted(x_range, x0 + 3 * sigma, side="right")
+        x_hatch = x_range[lo:hi]
 
-        # Include only the baseline and additional term
-        y_baseline = 4 * np.pi * x_hatch * rho + additional_term(x_hatch, A, n, lambda_)
-        y_hatch = y_gaussian + y_baseline
+        # Contribution of the specific gaussian plus the baseline and additional term
+        y_hatch = y_gaussians_range[lo:hi, i] + y_baseline_range[lo:hi]
 
         # Clip to positive values only
         y_hatch = y_hatch.clip(min=0)
 
-        if i >= peak_used_count:
-            break
-
         # Add hatch region
         plt.fill_between(
             x_hatch, y_hatch, alpha=0.15, label=rf"$\mathrm{{Peak \,\, {i + 1}}}$"
@@ -295,7 +380,8 @@ try:
     # plt.grid(axis="x", which="major", color="gray", linestyle="--", linewidth=0.5)
     plt.grid(True, linestyle=":")
 
-    plt.savefig("./figures/pdf_tr_fit.png", dpi=300)
-    plt.show()
+    plt.savefig("./figures/pdf_tr_fit.png", dpi=FIG_DPI)
+    if SHOW_PLOTS:
+        plt.show()
 except Exception as e:
     print(f"Fit failed: {e}")
@@ -0,0 +1,77 @@
+# Copyright 2025 Takahiro Matsumoto, Japan Synchrotron Radiation Research Institute
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Shared matplotlib settings for the figure scripts.
+
+Key Features:
+- Applies the MDPI article style (serif fonts, STIX math fonts, 8 x 6 inch figures)
+  together with the font sizes chosen by each script.
+- Selects the non-interactive Agg backend, so that saving the PNG files does not
+  initialize a GUI toolkit.
+- Provides tick labels that label every second (even) integer tick.
+- Plots are displayed on screen only if the environment variable SHOW_PLOTS is set
+  (e.g., 'SHOW_PLOTS=1 python code/cv_curve.py').
+- The PNG files are saved at 300 dpi; set the environment variable FIG_DPI to save
+  drafts at a lower resolution (e.g., 'FIG_DPI=100 python code/cv_curve.py').
+
+Dependencies:
+- matplotlib
+- numpy
+"""
+import os
+
+import matplotlib
+import numpy as np
+from matplotlib import rcParams
+
+# Display the plots on screen after saving them (set SHOW_PLOTS=1 to enable)
+SHOW_PLOTS = bool(os.environ.get("SHOW_PLOTS"))
+
+# Resolution of the saved PNG files (300 dpi for publication, lower for quick drafts)
+FIG_DPI = int(os.environ.get("FIG_DPI", "300"))
+
+# Settings common to all figures for MDPI article format
+MDPI_STYLE = {
+    "font.family": "serif",  # Use a serif font like Times New Roman
+    "mathtext.fontset": "stix",  # Use STIX fonts for math
+    "figure.figsize": (8, 6),  # Default figure size (width, height in inches)
+}
+
+
+# Function to select the backend and apply the MDPI style
+def apply_mdpi_style(font_sizes):
+    """
+    Apply the MDPI style with the font sizes of a script.
+
+    Parameters:
+        font_sizes (dict): rcParams font size entries (e.g., {"font.size": 12}).
+    """
+    if not SHOW_PLOTS:
+        matplotlib.use("Agg")
+    rcParams.update({**MDPI_STYLE, **font_sizes})
+
+
+# Function to label the even ticks and leave the odd ticks blank
+def even_tick_labels(ticks):
+    """
+    Create tick labels for every second integer tick.
+
+    Parameters:
+        ticks (array-like): Integer tick positions.
+
+    Returns:
+        numpy.ndarray: Tick labels ("" for the odd ticks).
+    """
+    ticks = np.asarray(ticks).astype(np.int64)
+    return np.where(ticks % 2 == 0, ticks.astype(str), "")
@@ -29,27 +29,24 @@ Input:
 - The script processes scattering intensity data from a specified file path.
 
 Dependencies:
-- pandas
 - numpy
 - matplotlib
 """
-import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.ticker import FuncFormatter
-from matplotlib import rcParams
+
+from plot_style import FIG_DPI, SHOW_PLOTS, apply_mdpi_style
 
 # Configure font and style settings for the plot
-rcParams.update(
+apply_mdpi_style(
     {
-        "font.family": "serif",  # Use a serif font family (e.g., Times New Roman)
-        "mathtext.fontset": "stix",  # Use STIX fonts for math text
         "font.size": 16,  # Base font size for the plot
         "axes.titlesize": 20,  # Font size for axis titles
         "axes.labelsize": 20,  # Font size for axis labels
         "xtick.labelsize": 16,  # Font size for X-axis tick labels
         "ytick.labelsize": 16,  # Font size for Y-axis tick labels
         "legend.fontsize": 20,  # Font size for the legend
-        "figure.figsize": (8, 6),  # Default figure size (width, height)
     }
 )
 
@@ -76,24 +73,28 @@ def format_log_ticks(value, _):
         return ""
 
 
-# Load the data file into a pandas DataFrame
+# Load the data file (skipping the column names) into a NumPy array
 file_path = (
     "./data/saxs_TEC10V30E_As_FE_00001__sum_Connected 2023-02-09_13-41-55_fit.dat"
 )
-data = pd.read_csv(file_path, sep=r"\s+", header=None)
+data = np.loadtxt(file_path, skiprows=1)
 
-# Extract and convert data columns to appropriate types
-x = data.iloc[1:, 0].astype(float)
-y1 = data.iloc[1:, 1].astype(float)
-y1_error = data.iloc[1:, 2].astype(float)
-y2 = data.iloc[1:, 3].astype(float)
-y2_error = data.iloc[1:, 4].astype(float)
+# Extract the data columns
+x = data[:, 0]
+y1 = data[:, 1]
+y1_error = data[:, 2]
+y2 = data[:, 3]
+y2_error = data[:, 4]
 
 # Scale the X values for better readability (divide by 1e9)
 x_scaled = x / 1e9
 
+# Draw at most about 120 error bars per data set; the bars of dense data sets
+# are thinned out (all points keep their markers)
+errorevery = max(1, int(np.ceil(len(x_scaled) / 120)))
+
 # Create a figure with a specific size
-plt.figure(figsize=(8, 6))
+plt.figure()  # Figure size from rcParams (8 x 6 inches)
 
 # Plot measured values with error bars
 plt.errorbar(
@@ -107,6 +108,7 @@ plt.errorbar(
     linewidth=0.7,  # Thinner error bar lines
     alpha=0.7,  # Transparency for better visibility
     capsize=3,  # Size of the caps on error bars
+    errorevery=errorevery,
 )
 
 # Plot fitted values with error bars
@@ -121,6 +123,7 @@ plt.errorbar(
     linewidth=0.7,  # Thinner error bar lines
     alpha=0.7,  # Transparency
     capsize=3,
+    errorevery=errorevery,
 )
 
 # Set logarithmic scale for both X and Y axes
@@ -176,7 +179,8 @@ plt.tight_layout()
 # Define the output file path and save the figure
 output_file_path = "./figures/saxs_mcsas_profile.png"
 print(f"The plot will be saved to: {output_file_path}")
-plt.savefig(output_file_path, dpi=300, bbox_inches="tight")
+plt.savefig(output_file_path, dpi=FIG_DPI, bbox_inches="tight")
 
 # Display the plot on screen
-plt.show()
+if SHOW_PLOTS:
+    plt.show()
@@ -29,54 +29,50 @@ Input:
 - The script processes radius distribution data from a specified file path.
 
 Dependencies:
-- pandas
+- numpy
 - matplotlib
 """
-import pandas as pd  # Pandas for data loading and manipulation
+import numpy as np  # NumPy for data loading
 import matplotlib.pyplot as plt  # Matplotlib for creating figures and plots
-from matplotlib import rcParams  # rcParams for customizing plot styles
+
+from plot_style import FIG_DPI, SHOW_PLOTS, apply_mdpi_style
 
 # Configure overall font and style settings for the plot
-rcParams.update(
+apply_mdpi_style(
     {
-        "font.family": "serif",  # Use a serif font family (e.g., Times New Roman)
-        "mathtext.fontset": "stix",  # Use STIX fonts for math text (LaTeX-like appearance)
         "font.size": 10,  # Base font size for all text
         "axes.titlesize": 12,  # Font size for axis titles
         "axes.labelsize": 18,  # Font size for axis labels
         "xtick.labelsize": 14,  # Font size for X-axis tick labels
         "ytick.labelsize": 14,  # Font size for Y-axis tick labels
         "legend.fontsize": 16,  # Font size for the legend text
-        "figure.figsize": (8, 6),  # Default figure dimensions (width, height in inches)
     }
 )
 
 # Specify the path to the input data file
 file_path = "./data/saxs_TEC10V30E_As_FE_00001__sum_Connected 2023-02-09_13-41-55_hist-radius-True-0(nm)-10(nm)-50-lin-vol.dat"
 
-# Load the data from a text file into a pandas DataFrame.
-# - 'header=None' means there is no header row in the file.
-# - 'skiprows=1' skips the first row.
-# - 'sep=r'\s+'' tells pandas the file is space-separated.
-data = pd.read_csv(file_path, header=None, skiprows=1, sep=r"\s+")
+# Load the data from a whitespace-separated text file into a NumPy array.
+# - 'skiprows=1' skips the first row (column names).
+data = np.loadtxt(file_path, skiprows=1)
 
-# Extract columns from the DataFrame into separate variables:
+# Extract columns from the array into separate variables:
 # x: radius in meters -> convert to nanometers by multiplying by 1e9
 # y: volume fraction histogram
 # y_err: error of the histogram
 # obs: minimum visibility limit
 # cdf: cumulative distribution function
 # cdf_err: error of the CDF
-x = data.iloc[:, 0] * 1e9
-y = data.iloc[:, 2]
-y_err = data.iloc[:, 3]
-obs = data.iloc[:, 4]
-cdf = data.iloc[:, 5]
-cdf_err = data.iloc[:, 6]
+x = data[:, 0] * 1e9
+y = data[:, 2]
+y_err = data[:, 3]
+obs = data[:, 4]
+cdf = data[:, 5]
+cdf_err = data[:, 6]
 
 # Create a figure and a set of axes for plotting. We use subplots to have
 # better control over the figure and axes objects.
-fig, ax1 = plt.subplots(figsize=(8, 6))
+fig, ax1 = plt.subplots()  # Figure size from rcParams (8 x 6 inches)
 
 # Plot the histogram (left Y-axis)
 bar_width = 0.2  # Width of each bar in the histogram
@@ -142,7 +138,8 @@ plt.tight_layout()
 # Define the output file path and save the plot as a PNG with 300 dpi resolution
 output_file_path = "./figures/saxs_mcsas_radius.png"
 print(f"The plot will be saved to: {output_file_path}")
-plt.savefig(output_file_path, dpi=300, bbox_inches="tight")
+plt.savefig(output_file_path, dpi=FIG_DPI, bbox_inches="tight")
 
 # Show the plot on the screen
-plt.show()
+if SHOW_PLOTS:
+    plt.show()
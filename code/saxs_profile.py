@@ -35,20 +35,18 @@ Dependencies:
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.ticker import FuncFormatter
-from matplotlib import rcParams
+
+from plot_style import FIG_DPI, SHOW_PLOTS, apply_mdpi_style
 
 # Set font style for MDPI article format
-rcParams.update(
+apply_mdpi_style(
     {
-        "font.family": "serif",  # Use a serif font like Times New Roman
-        "mathtext.fontset": "stix",  # Use STIX fonts for math text
         "font.size": 10,  # Adjust font size to MDPI recommendations
         "axes.titlesize": 18,  # Larger title size
         "axes.labelsize": 18,  # Axis label size
         "xtick.labelsize": 14,  # X-axis tick label size
         "ytick.labelsize": 14,  # Y-axis tick label size
         "legend.fontsize": 14,  # Legend font size
-        "figure.figsize": (8, 6),  # Default figure size
     }
 )
 
@@ -64,19 +62,11 @@ def read_data(file_path):
     Returns:
         numpy.ndarray: Array of [Q, Intensity].
     """
-    data = []
-    with open(file_path, "r") as f:
-        for i, line in enumerate(f):
-            if i < 4:  # Skip header lines
-                continue
-            if "NAN" in line or line.strip() == "":
-                continue
-            parts = line.split()
-            if len(parts) >= 2:  # At least Q and Intensity are required
-                q_value = float(parts[0])
-                intensity = float(parts[1])
-                data.append((q_value, intensity))
-    return np.array(data)
+    # Parse all columns with NumPy's C parser ("NAN" entries are read as NaN)
+    data = np.loadtxt(file_path, skiprows=4, ndmin=2)
+
+    # Drop the rows containing NaN and keep the Q and Intensity columns
+    return data[~np.isnan(data).any(axis=1), :2]
 
 
 # Customize X-axis tick labels
@@ -121,7 +111,15 @@ for label, (file_path, color) in files.items():
     if data.size > 0:
         q_values = data[:, 0]
         intensities = data[:, 1]
-        ax.plot(q_values, intensities, label=label, color=color, linestyle="-")
+        # Rasterize the dense curves when saving to vector formats (no effect on PNG output)
+        ax.plot(
+            q_values,
+            intensities,
+            label=label,
+            color=color,
+            linestyle="-",
+            rasterized=True,
+        )
 
 # Set log-log scale for axes
 ax.set_xscale("log")
@@ -161,5 +159,6 @@ ax.legend(ordered_handles, legend_labels, loc="best")
 # Save figure to PNG file
 output_file_path = "./figures/saxs_profile.png"
 print(f"The plot will be saved to: {output_file_path}")
-plt.savefig(output_file_path, dpi=300, bbox_inches="tight")
-plt.show()
+plt.savefig(output_file_path, dpi=FIG_DPI, bbox_inches="tight")
+if SHOW_PLOTS:
+    plt.show()
@@ -29,27 +29,24 @@ Output:
 - A PNG file './figures/xafs_chik.png' with a visual representation of k²χ(k) as a function of k.
 
 Dependencies:
+- numpy
 - matplotlib
 """
 
+import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib import rcParams
+
+from plot_style import FIG_DPI, SHOW_PLOTS, apply_mdpi_style
 
 # Update matplotlib settings to match the MDPI article format
-rcParams.update(
+apply_mdpi_style(
     {
-        "font.family": "serif",  # Use serif font style (e.g., Times New Roman)
-        "mathtext.fontset": "stix",  # Use STIX fonts for math
         "font.size": 12,  # Set base font size
         "axes.titlesize": 20,  # Set size of axis titles
         "axes.labelsize": 20,  # Set size of axis labels
         "xtick.labelsize": 14,  # Set size of x-axis tick labels
         "ytick.labelsize": 14,  # Set size of y-axis tick labels
         "legend.fontsize": 20,  # Set size of legend text
-        "figure.figsize": (
-            8,
-            6,
-        ),  # Define default figure size (width, height in inches)
     }
 )
 
@@ -67,44 +64,45 @@ y_min, y_max = -0.8, 1.0  # k²χ(k) value range in Å⁻²
 # Specify the sample name for labeling in the plot
 sample_name = r"$\mathrm{TEC10E50E}$"
 
-# Initialize lists to store wavenumber (k) and k²χ(k) values
-k = []
-chik3 = []
 
-# Read the data file and parse the content
-with open(file_path, "r") as file:
+# Function to plot k²χ(k) as a function of the wavenumber
+def make_figure(file_path, out_path):
+    """
+    Plot k²χ(k) of the sample and save the figure.
+
+    Parameters:
+        file_path (str): Path of the input data file.
+        out_path (str): Path of the output PNG file.
+    """
+    # Read the wavenumber (k) and k²χ(k) values (column 4)
+    # (comment lines starting with '#' are skipped)
     print(f"Reading data from: {file_path}")
-    for line in file:
-        if not line.startswith("#"):  # Ignore comment lines (starting with '#')
-            parts = line.split()  # Split line into parts based on whitespace
-            if len(parts) >= 2:  # Ensure the line has at least two columns
-                try:
-                    # Append parsed values to the respective lists
-                    k.append(float(parts[0]))  # Wavenumber (k) values
-                    chik3.append(float(parts[3]))  # k²χ(k) values from column 4
-                except ValueError:
-                    # Skip lines with non-numeric values
-                    continue
-
-# Plot the parsed data
-plt.figure(figsize=(8, 6))  # Create a figure with specified size
-plt.plot(k, chik3, "k-", label=sample_name)  # Plot data with a black solid line
-
-# Update axis labels with proper math notation and font sizes
-plt.xlabel(r"$\mathrm{Wavenumber} \,\, (\mathrm{\AA}^{-1})$")
-plt.ylabel(r"$k^{2} \chi(k) \,\, (\mathrm{\AA}^{-2})$")
-
-
-# plt.legend(fontsize=12)  # Add legend with specified font size
-plt.grid(True, linestyle=":")  # Add grid with dotted lines
-
-# Set x-axis and y-axis ranges for better focus on the data
-plt.xlim(x_min, x_max) 
-plt.ylim(y_min, y_max) 
-
-# Save the plot as a PNG file with high resolution
-print(f"The plot will be saved to: {output_file_path}")
-plt.savefig(output_file_path, dpi=300)  # Save the figure as PNG (300 DPI)
-
-# Display the plot on the screen
-plt.show()
+    k, chik3 = np.loadtxt(file_path, comments="#", usecols=(0, 3), unpack=True)
+
+    # Plot the parsed data
+    fig, ax = plt.subplots()  # Figure size from rcParams (8 x 6 inches)
+    ax.plot(k, chik3, "k-", label=sample_name)  # Plot data with a black solid line
+
+    # Update axis labels with proper math notation and font sizes
+    ax.set_xlabel(r"$\mathrm{Wavenumber} \,\, (\mathrm{\AA}^{-1})$")
+    ax.set_ylabel(r"$k^{2} \chi(k) \,\, (\mathrm{\AA}^{-2})$")
+
+    # ax.legend(fontsize=12)  # Add legend with specified font size
+    ax.grid(True, linestyle=":")  # Add grid with dotted lines
+
+    # Set x-axis and y-axis ranges for better focus on the data
+    ax.set_xlim(x_min, x_max) 
+    ax.set_ylim(y_min, y_max) 
+
+    # Save the plot as a PNG file with high resolution (FIG_DPI, 300 by default)
+    print(f"The plot will be saved to: {out_path}")
+    fig.savefig(out_path, dpi=FIG_DPI)
+
+    # Display the plot on the screen
+    if SHOW_PLOTS:
+        plt.show()
+    plt.close(fig)
+
+
+if __name__ == "__main__":
+    make_figure(file_path, output_file_path)
@@ -34,6 +34,7 @@ Output:
 - A PNG file './figures/xafs_chik_fit.png' displaying the experimental and fitted k²χ(k) as a function of the wavenumber.
 
 Dependencies:
+- numpy: Used for loading the data file.
 - matplotlib: Used for creating and customizing the plot.
 
 Usage Notes:
@@ -41,21 +42,20 @@ Usage Notes:
 - Modify the axis ranges or styles in the code if the dataset requires different visualization settings.
 """
 
+import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib import rcParams
+
+from plot_style import FIG_DPI, SHOW_PLOTS, apply_mdpi_style
 
 # Update matplotlib settings to match the MDPI article format
-rcParams.update(
+apply_mdpi_style(
     {
-        "font.family": "serif",  # Use serif font style (e.g., Times New Roman)
-        "mathtext.fontset": "stix",  # Use STIX fonts for math
         "font.size": 12,  # Set base font size
         "axes.titlesize": 20,  # Set size of axis titles
         "axes.labelsize": 20,  # Set size of axis labels
         "xtick.labelsize": 14,  # Set size of x-axis tick labels
         "ytick.labelsize": 14,  # Set size of y-axis tick labels
         "legend.fontsize": 20,  # Set size of legend text
-        "figure.figsize": (8, 6),  # Default figure size (width, height in inches)
     }
 )
 
@@ -72,57 +72,59 @@ y_min, y_max = -0.8, 1.0  # k²χ(k) value range in Å⁻²
 # Specify the sample name for labeling in the plot
 sample_name = r"$\mathrm{TEC10E50E}$"
 
-# Initialize lists to store wavenumber (k) and k²χ(k) values
-k = []
-chik3 = []
-chik3_fit = []
 
-# Read and parse the data file
-with open(file_path, "r") as file:
+# Function to plot the experimental and fitted k²χ(k)
+def make_figure(file_path, out_path):
+    """
+    Plot the experimental and fitted k²χ(k) and save the figure.
+
+    Parameters:
+        file_path (str): Path of the input data file.
+        out_path (str): Path of the output PNG file.
+    """
+    # Read the wavenumber (k), experimental and fitted k²χ(k) values
+    # (comment lines starting with '#' are skipped)
     print(f"Reading data from: {file_path}")
-    for line in file:
-        if not line.startswith("#"):  # Ignore comment lines (starting with '#')
-            parts = line.split()  # Split line into columns based on whitespace
-            if len(parts) >= 3:  # Ensure the line has at least two columns
-                try:
-                    # Append parsed values to the respective lists
-                    k.append(float(parts[0]))  # Wavenumber (k) values
-                    chik3.append(float(parts[1]))  # Experimental k²χ(k) values
-                    chik3_fit.append(float(parts[2]))  # Fitted k²χ(k) values
-                except ValueError:
-                    # Skip lines with non-numeric values
-                    continue
-
-# Create a new figure for the plot
-plt.figure(figsize=(8, 6))
-
-# Plot experimental data with a black solid line and transparency
-plt.plot(
-    k, chik3, "k-", label=r"$\mathrm{Exp.}$", alpha=0.7, linewidth=1.5
-)
+    k, chik3, chik3_fit = np.loadtxt(
+        file_path, comments="#", usecols=(0, 1, 2), unpack=True
+    )
 
-# Plot fitted data with a red dashed line and transparency
-plt.plot(
-    k, chik3_fit, "r--", label=r"$\mathrm{Fit}$", alpha=0.7, linewidth=1.5
-)
+    # Create a new figure for the plot
+    fig, ax = plt.subplots()  # Figure size from rcParams (8 x 6 inches)
+
+    # Plot experimental data with a black solid line and transparency
+    ax.plot(
+        k, chik3, "k-", label=r"$\mathrm{Exp.}$", alpha=0.7, linewidth=1.5
+    )
+
+    # Plot fitted data with a red dashed line and transparency
+    ax.plot(
+        k, chik3_fit, "r--", label=r"$\mathrm{Fit}$", alpha=0.7, linewidth=1.5
+    )
+
+    # Set axis labels with proper math notation
+    ax.set_xlabel(r"$\mathrm{Wavenumber} \,\, (\mathrm{\AA}^{-1})$")
+    ax.set_ylabel(r"$k^{2} \chi(k) \,\, (\mathrm{\AA}^{-2})$")
+
+    # Add a legend to the plot
+    ax.legend()
 
-# Set axis labels with proper math notation
-plt.xlabel(r"$\mathrm{Wavenumber} \,\, (\mathrm{\AA}^{-1})$")
-plt.ylabel(r"$k^{2} \chi(k) \,\, (\mathrm{\AA}^{-2})$")
+    # Add a grid with dotted lines and slight transparency
+    ax.grid(True, linestyle=":", alpha=0.6)
 
-# Add a legend to the plot
-plt.legend()
+    # Set axis limits for better focus on the data
+    ax.set_xlim(x_min, x_max)
+    ax.set_ylim(y_min, y_max)
 
-# Add a grid with dotted lines and slight transparency
-plt.grid(True, linestyle=":", alpha=0.6)
+    # Save the plot as a PNG file with high resolution
+    print(f"The plot will be saved to: {out_path}")
+    fig.savefig(out_path, dpi=FIG_DPI)
 
-# Set axis limits for better focus on the data
-plt.xlim(x_min, x_max)
-plt.ylim(y_min, y_max)
+    # Display the plot
+    if SHOW_PLOTS:
+        plt.show()
+    plt.close(fig)
 
-# Save the plot as a PNG file with high resolution
-print(f"The plot will be saved to: {output_file_path}")
-plt.savefig(output_file_path, dpi=300)
 
-# Display the plot
-plt.show()
+if __name__ == "__main__":
+    make_figure(file_path, output_file_path)
@@ -32,24 +32,24 @@ Output:
 - A PNG file './figures/xafs_chir_fit.png' showing the comparison between experimental and fitted |χ(R)| as a function of r.
 
 Dependencies:
+- numpy
 - matplotlib
 """
 
+import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib import rcParams
+
+from plot_style import FIG_DPI, SHOW_PLOTS, apply_mdpi_style
 
 # Update matplotlib settings to match the MDPI article format
-rcParams.update(
+apply_mdpi_style(
     {
-        "font.family": "serif",  # Use serif font style (e.g., Times New Roman)
-        "mathtext.fontset": "stix",  # Use STIX fonts for rendering mathematical expressions
         "font.size": 12,  # Set the base font size for all text elements
         "axes.titlesize": 20,  # Set the font size for the axes titles
         "axes.labelsize": 20,  # Set the font size for the axes labels
         "xtick.labelsize": 14,  # Set the font size for x-axis tick labels
         "ytick.labelsize": 14,  # Set the font size for y-axis tick labels
         "legend.fontsize": 20,  # Set the font size for the legend
-        "figure.figsize": (8, 6),  # Define the default figure size (width, height in inches)
     }
 )
 
@@ -68,56 +68,58 @@ y_min, y_max = -0.8, 1.0  # Minimum and maximum y-axis values
 # Specify the sample name for display in the plot legend
 sample_name = r"$\mathrm{TEC10E50E}$"  # Rendered in LaTeX-style math font
 
-# Initialize lists to store parsed data from the input file
-r = []         # Radial distance values
-chir = []      # χ(R) values (experimental data)
-chir_fit = []  # χ(R) fit values (fitted data)
 
-# Read the input data file and parse its contents
-with open(file_path, "r") as file:
+# Function to plot the experimental and fitted |χ(R)|
+def make_figure(file_path, out_path):
+    """
+    Plot the experimental and fitted |χ(R)| and save the figure.
+
+    Parameters:
+        file_path (str): Path of the input data file.
+        out_path (str): Path of the output PNG file.
+    """
+    # Read the radial distance (r), experimental and fitted χ(R) values
+    # (comment lines starting with '#' are skipped)
     print(f"Reading data from: {file_path}")
-    for line in file:
-        if not line.startswith("#"):  # Ignore lines starting with '#' (comments)
-            parts = line.split()  # Split the line into parts based on whitespace
-            if len(parts) >= 3:  # Ensure the line contains at least three columns
-                try:
-                    # Parse and append numerical values to respective lists
-                    r.append(float(parts[0]))         # First column: radial distance
-                    chir.append(float(parts[1]))      # Second column: χ(R) values
-                    chir_fit.append(float(parts[2]))  # Third column: χ(R) fit values
-                except ValueError:
-                    # Skip the line if it contains non-numeric values
-                    continue
-
-# Create a figure with the specified dimensions
-plt.figure(figsize=(8, 6))
-
-# Plot the experimental χ(R) data as a black solid line
-plt.plot(
-    r, chir, "k-", label=r"$\mathrm{Exp.}$", alpha=0.7, linewidth=1.5
-)
+    r, chir, chir_fit = np.loadtxt(
+        file_path, comments="#", usecols=(0, 1, 2), unpack=True
+    )
 
-# Plot the fitted χ(R) data as a red dashed line
-plt.plot(
-    r, chir_fit, "r--", label=r"$\mathrm{Fit}$", alpha=0.7, linewidth=1.5
-)
+    # Create a figure with the specified dimensions
+    fig, ax = plt.subplots()  # Figure size from rcParams (8 x 6 inches)
+
+    # Plot the experimental χ(R) data as a black solid line
+    ax.plot(
+        r, chir, "k-", label=r"$\mathrm{Exp.}$", alpha=0.7, linewidth=1.5
+    )
+
+    # Plot the fitted χ(R) data as a red dashed line
+    ax.plot(
+        r, chir_fit, "r--", label=r"$\mathrm{Fit}$", alpha=0.7, linewidth=1.5
+    )
+
+    # Add labels to the axes using LaTeX-style formatting
+    ax.set_xlabel(r"$\mathrm{Radial \,\, distance} \,\, (\mathrm{\AA})$")
+    ax.set_ylabel(r"$|\chi(R)| \,\, (\mathrm{\AA}^{-3})$")
+
+    # Add a legend to the plot
+    ax.legend()
 
-# Add labels to the axes using LaTeX-style formatting
-plt.xlabel(r"$\mathrm{Radial \,\, distance} \,\, (\mathrm{\AA})$")  # x-axis label
-plt.ylabel(r"$|\chi(R)| \,\, (\mathrm{\AA}^{-3})$")  # y-axis label
+    # Enable the grid with dotted lines for better readability
+    ax.grid(True, linestyle=":")
 
-# Add a legend to the plot
-plt.legend()
+    # Set the range of the x-axis to focus on the region of interest
+    ax.set_xlim(x_min, x_max)
 
-# Enable the grid with dotted lines for better readability
-plt.grid(True, linestyle=":")
+    # Save the resulting plot to the output file with high resolution (300 DPI)
+    print(f"The plot will be saved to: {out_path}")
+    fig.savefig(out_path, dpi=FIG_DPI)
 
-# Set the range of the x-axis to focus on the region of interest
-plt.xlim(x_min, x_max)
+    # Display the plot on the screen
+    if SHOW_PLOTS:
+        plt.show()
+    plt.close(fig)
 
-# Save the resulting plot to the specified output file with high resolution (300 DPI)
-print(f"The plot will be saved to: {output_file_path}")
-plt.savefig(output_file_path, dpi=300)
 
-# Display the plot on the screen
-plt.show()
+if __name__ == "__main__":
+    make_figure(file_path, output_file_path)
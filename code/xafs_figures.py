@@ -0,0 +1,65 @@
+# Copyright 2025 Takahiro Matsumoto, Japan Synchrotron Radiation Research Institute
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+This script generates all five XAFS figures of the standard sample TEC10E50E in one run.
+
+Key Features:
+- Calls the 'make_figure' functions of 'xafs_norm.py', 'xafs_chik.py', 'xafs_chir.py',
+  'xafs_chik_fit.py' and 'xafs_chir_fit.py' with their input and output paths.
+- Python, numpy, matplotlib and the MDPI style are initialized only once for all figures.
+- The figures are drawn in parallel worker processes (one after another when SHOW_PLOTS
+  is set, so that the windows are shown by the main process).
+
+Input:
+- The data files specified by the 'file_path' variables of the five scripts.
+
+Output:
+- './figures/xafs_norm.png'
+- './figures/xafs_chik.png'
+- './figures/xafs_chir.png'
+- './figures/xafs_chik_fit.png'
+- './figures/xafs_chir_fit.png'
+
+Dependencies:
+- numpy
+- matplotlib
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import xafs_chik
+import xafs_chik_fit
+import xafs_chir
+import xafs_chir_fit
+import xafs_norm
+from plot_style import SHOW_PLOTS
+
+# The scripts in the order of the article
+scripts = (xafs_norm, xafs_chik, xafs_chir, xafs_chik_fit, xafs_chir_fit)
+
+if __name__ == "__main__":
+    if SHOW_PLOTS:
+        # Draw the figures one after another and show each on screen
+        for script in scripts:
+            script.make_figure(script.file_path, script.output_file_path)
+    else:
+        # The figures are independent, so they are drawn in parallel processes
+        with ProcessPoolExecutor() as executor:
+            futures = [
+                executor.submit(
+                    script.make_figure, script.file_path, script.output_file_path
+                )
+                for script in scripts
+            ]
+            for future in futures:
+                future.result()  # Re-raise any error of a worker process
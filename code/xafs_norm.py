@@ -28,29 +28,25 @@ Output:
 - A PNG file './figures/xafs_norm.png' that visually represents the normalized μ(E) data.
 
 Dependencies:
+- numpy
 - matplotlib
 """
 
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.ticker as ticker
 
-from matplotlib import rcParams
+from plot_style import FIG_DPI, SHOW_PLOTS, apply_mdpi_style
 
 # Update matplotlib settings to match the MDPI article format
-rcParams.update(
+apply_mdpi_style(
     {
-        "font.family": "serif",  # Use serif font style (e.g., Times New Roman)
-        "mathtext.fontset": "stix",  # Use STIX fonts for math
         "font.size": 12,  # Set base font size
         "axes.titlesize": 20,  # Set size of axis titles
         "axes.labelsize": 20,  # Set size of axis labels
         "xtick.labelsize": 14,  # Set size of x-axis tick labels
         "ytick.labelsize": 14,  # Set size of y-axis tick labels
         "legend.fontsize": 20,  # Set size of legend text
-        "figure.figsize": (
-            8,
-            6,
-        ),  # Define default figure size (width, height in inches)
     }
 )
 
@@ -67,48 +63,53 @@ x_min, x_max = 11530, 11615
 # (Change as per the data being analyzed)
 sample_name = r"$\mathrm{TEC10E50E}$"
 
-# Initialize lists to store energy and normalized μ(E) values
-energy = []
-normalized_mut = []
 
-# Read the data file and parse the content
-with open(file_path, "r") as file:
+# Function to plot the normalized μ(E) spectrum
+def make_figure(file_path, out_path):
+    """
+    Plot the normalized μ(E) spectrum and save the figure.
+
+    Parameters:
+        file_path (str): Path of the input data file.
+        out_path (str): Path of the output PNG file.
+    """
+    # Read the energy and normalized μ(E) values
+    # (comment lines starting with '#' are skipped)
     print(f"Reading data from: {file_path}")
-    for line in file:
-        if not line.startswith("#"):  # Ignore comment lines (starting with '#')
-            parts = line.split()  # Split line into parts based on whitespace
-            if len(parts) >= 2:  # Ensure the line has at least two columns
-                try:
-                    # Append parsed values to the respective lists
-                    energy.append(float(parts[0]))  # Energy values
-                    normalized_mut.append(float(parts[1]))  # Normalized μ(E) values
-                except ValueError:
-                    # Skip lines with non-numeric values
-                    continue
+    energy, normalized_mut = np.loadtxt(
+        file_path, comments="#", usecols=(0, 1), unpack=True
+    )
+
+    # Plot the parsed data
+    fig, ax = plt.subplots()  # Figure size from rcParams (8 x 6 inches)
+    ax.plot(
+        energy, normalized_mut, "k-", label=sample_name
+    )  # Plot data with a black solid line
 
-# Plot the parsed data
-plt.figure(figsize=(8, 6))  # Create a figure with specified size
-plt.plot(
-    energy, normalized_mut, "k-", label=sample_name
-)  # Plot data with a black solid line
+    ax.set_xlabel(r"$\mathrm{Energy} \, (\mathrm{eV})$")
+    ax.set_ylabel(r"Normalized $\mu(E)$ (a.u.)")
 
-plt.xlabel(r"$\mathrm{Energy} \, (\mathrm{eV})$")
-plt.ylabel(r"Normalized $\mu(E)$ (a.u.)")
+    ax.legend()
 
-plt.legend()
+    ax.grid(True, linestyle=":")  # Add grid with dotted lines
 
-plt.grid(True, linestyle=":")  # Add grid with dotted lines
+    # Set x-axis range for better focus on the region of interest
+    ax.set_xlim(x_min, x_max)
 
-# Set x-axis range for better focus on the region of interest
-plt.xlim(x_min, x_max)
+    # Add comma separators to x-axis ticks (e.g., 10000 → 10,000)
+    ax.xaxis.set_major_formatter(
+        ticker.FuncFormatter(lambda x, _: f"{int(x):,}")
+    )
 
-# Add comma separators to x-axis ticks (e.g., 10000 → 10,000)
-plt.gca().xaxis.set_major_formatter(ticker.FuncFormatter(lambda x, _: f"{int(x):,}"))
+    # Save the plot as a PNG file (FIG_DPI, 300 by default)
+    print(f"The plot will be saved to: {out_path}")
+    fig.savefig(out_path, dpi=FIG_DPI)
 
+    # Display the plot on the screen
+    if SHOW_PLOTS:
+        plt.show()
+    plt.close(fig)
 
-# Save the plot as a PNG file
-print(f"The plot will be saved to: {output_file_path}")
-plt.savefig(output_file_path, dpi=300)  # Save the figure with high resolution (300 DPI)
 
-# Display the plot on the screen
-plt.show()
+if __name__ == "__main__":
+    make_figure(file_path, output_file_path)
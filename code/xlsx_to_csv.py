@@ -0,0 +1,44 @@
+# Copyright 2025 Takahiro Matsumoto, Japan Synchrotron Radiation Research Institute
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+This script exports the FC-Benten standard sample dataset from Excel to CSV.
+
+Key Features:
+- The Excel workbook remains the editable source of the dataset.
+- The figure scripts read the exported CSV file, which is much faster to parse than XLSX.
+- Run this script again after editing the workbook and commit the updated CSV file.
+
+Input:
+- './data/fcbenten_standard_sample_data.xlsx', sheet 'data'.
+
+Output:
+- './data/fcbenten_standard_sample_data.csv' containing all columns of the sheet.
+
+Dependencies:
+- pandas
+- openpyxl
+"""
+import pandas as pd
+
+# Specify the paths of the Excel file and the CSV file
+file_path = "./data/fcbenten_standard_sample_data.xlsx"
+csv_file_path = "./data/fcbenten_standard_sample_data.csv"
+
+# Print the file paths being used
+print(f"Reading data from: {file_path}")
+
+# Load the 'data' sheet and write it to the CSV file
+df = pd.read_excel(file_path, sheet_name="data", engine="openpyxl")
+print(f"The data will be saved to: {csv_file_path}")
+df.to_csv(csv_file_path, index=False)
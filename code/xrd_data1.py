@@ -25,31 +25,32 @@ Key Features:
 
 Input:
 - './data/xrd_data.xlsx': An Excel file containing columns for 2θ and intensity data.
+- The parsed sheets are cached next to the Excel file (see data_io.py), so later runs
+  skip the Excel parsing.
 
 Dependencies:
-- math
+- numpy
 - pandas
+- openpyxl
 - matplotlib
 """
 
-import math
-import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.ticker as ticker
-from matplotlib import rcParams
+import numpy as np
+
+from data_io import read_excel_cached
+from plot_style import FIG_DPI, SHOW_PLOTS, apply_mdpi_style
 
 # Update matplotlib settings to match the MDPI article format
-rcParams.update(
+apply_mdpi_style(
     {
-        "font.family": "serif",  # Use a serif font like Times New Roman
-        "mathtext.fontset": "stix",  # Use STIX fonts for math
         "font.size": 12,  # General font size
         "axes.titlesize": 20,  # Axis title size
         "axes.labelsize": 20,  # Axis label size
         "xtick.labelsize": 14,  # X-axis tick label size
         "ytick.labelsize": 14,  # Y-axis tick label size
         "legend.fontsize": 14,  # Legend font size
-        "figure.figsize": (8, 6),  # Default figure size
     }
 )
 
@@ -95,28 +96,33 @@ p_CeO2_dict = {
     (6, 2, 0): [None, -0.5, 15000],
 }
 
-# Calculate 2θ values for the target material
-for hkl, v in p_target_dict.items():
-    d = a_target / math.sqrt(sum(x**2 for x in hkl))
-    twotheta = 2.0 * math.degrees(
-        math.asin(Const.n * Const.hbarc * math.pi / (d * Const.E))
-    )
-    v[0] = twotheta
+# n·λ/2 of Bragg's law n·λ = 2·d·sin(θ), with λ = 2π·ħc/E (Å)
+n_half_wavelength = Const.n * Const.hbarc * np.pi / Const.E
 
-# Calculate 2θ values for CeO2
-for hkl, v in p_CeO2_dict.items():
-    d = a_CeO2 / math.sqrt(sum(x**2 for x in hkl))
-    twotheta = 2.0 * math.degrees(
-        math.asin(Const.n * Const.hbarc * math.pi / (d * Const.E))
-    )
-    v[0] = twotheta
+# Calculate 2θ values for the target material and CeO2 (all reflections at once)
+for a, p_dict in ((a_target, p_target_dict), (a_CeO2, p_CeO2_dict)):
+    hkl = np.array(list(p_dict))  # One row of Miller indices per reflection
+    d = a / np.sqrt((hkl**2).sum(axis=1))
+    twotheta = 2.0 * np.degrees(np.arcsin(n_half_wavelength / d))
+    for v, value in zip(p_dict.values(), twotheta.tolist()):
+        v[0] = value
 
 # Load the Excel file containing XRD data
 file_path = "./data/xrd_data.xlsx"  # Path to the input Excel file
-excel_data = pd.ExcelFile(file_path)
 
-# Extract data from the 'data1' sheet
-data1 = excel_data.parse("data1")
+# Extract data from the 'data1' sheet, reusing the cached copy when available
+# (only the columns used below are read)
+data1 = read_excel_cached(
+    file_path,
+    sheet_name="data1",
+    usecols=[
+        "twotheta",
+        "TEC10V50E",
+        "Background - Lindemann glass capillary",
+        "twotheta CeO2",
+        "CeO2",
+    ],
+)
 
 # Extract relevant columns from the data
 twotheta = data1["twotheta"]
@@ -160,7 +166,7 @@ plt.gca().set_xticks(range(5, 61, 5), minor=False)  # Major ticks at multiples o
 plt.gca().set_xticklabels([str(i) for i in range(5, 61, 5)])  # Major tick labels
 
 # Add comma formatting for y-axis tick labels
-plt.gca().yaxis.set_major_formatter(ticker.FuncFormatter(lambda x, pos: f"{int(x):,}"))
+plt.gca().yaxis.set_major_formatter(ticker.StrMethodFormatter("{x:,.0f}"))
 
 # Add vertical grid lines for major ticks
 plt.grid(axis="x", which="major", color="gray", linestyle="--", linewidth=0.5)
@@ -195,7 +201,8 @@ output_file_path = "./figures/xrd_data1.png"  # Path to save the plot
 print(f"The plot will be saved to: {output_file_path}")
 
 # Save the plot as a PNG file
-plt.savefig(output_file_path, dpi=300)
+plt.savefig(output_file_path, dpi=FIG_DPI)
 
 # Display the plot
-plt.show()
+if SHOW_PLOTS:
+    plt.show()
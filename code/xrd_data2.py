@@ -24,58 +24,70 @@ Input:
 - An Excel file specified by the 'file_path' variable, containing:
   - XRD pattern data (2θ and intensity profiles).
   - Williamson-Hall plot data (sinθ/λ and βcosθ/λ values).
+- The parsed sheets are cached next to the Excel file (see data_io.py), so later runs
+  skip the Excel parsing.
 
 Output:
 - A PNG file './figures/xrd_data2.png' that combines the XRD pattern and Williamson-Hall plot in a visually appealing layout.
 
 Dependencies:
 - pandas
+- openpyxl
 - matplotlib
 - numpy
-- scipy
 """
 
-import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.ticker as ticker
-from matplotlib import rcParams
 import numpy as np
-from scipy.stats import linregress
+
+from data_io import read_excel_cached
+from plot_style import FIG_DPI, SHOW_PLOTS, apply_mdpi_style
 
 # Update matplotlib settings to match the MDPI article format
 # Customize fonts, figure size, and other style settings
-rcParams.update(
+apply_mdpi_style(
     {
-        "font.family": "serif",  # Use a serif font like Times New Roman
-        "mathtext.fontset": "stix",  # Use STIX fonts for math
         "font.size": 14,
         "axes.titlesize": 18,
         "axes.labelsize": 18,
         "xtick.labelsize": 14,
         "ytick.labelsize": 14,
         "legend.fontsize": 12,
-        "figure.figsize": (8, 6),
     }
 )
 
 # Load data for both plots
-# Load XRD data from an Excel file
+# Load XRD data from an Excel file, reusing the cached copies when available
 file_path = "./data/xrd_data.xlsx"
-data = pd.ExcelFile(file_path)
-data2 = data.parse("data2")  # Main dataset for plot 1
-data2_williamson_hall = pd.read_excel(
+# Main dataset for plot 1 (only the columns used below are read)
+data2 = read_excel_cached(
+    file_path,
+    sheet_name="data2",
+    usecols=[
+        "twotheta",
+        "Observed",
+        "Calculated",
+        "Background",
+        "Difference profiles",
+        "bragg peaks_twotheta",
+        "bragg peaks",
+    ],
+)
+data2_williamson_hall = read_excel_cached(
     file_path, sheet_name="data2_williamson_hall"
 )  # Dataset for Williamson-Hall plot
 
 # Extract data for plot 1
-# Data needed for the main plot
-twotheta = data2["twotheta"]
-observed = data2["Observed"]
-calculated = data2["Calculated"]
-background = data2["Background"]
-difference_profiles = data2["Difference profiles"]
-bragg_peaks_twotheta = data2["bragg peaks_twotheta"]
-bragg_peaks = data2["bragg peaks"]
+# Data needed for the main plot (converted to NumPy arrays once; the 2θ array is
+# shared by all profiles)
+twotheta = data2["twotheta"].to_numpy()
+observed = data2["Observed"].to_numpy()
+calculated = data2["Calculated"].to_numpy()
+background = data2["Background"].to_numpy()
+difference_profiles = data2["Difference profiles"].to_numpy()
+bragg_peaks_twotheta = data2["bragg peaks_twotheta"].to_numpy()
+bragg_peaks = data2["bragg peaks"].to_numpy()
 
 # Reflection data for annotations
 # Dictionary of Bragg reflection peaks with their positions and annotation details
@@ -92,14 +104,35 @@ p_target_dict = {
 }
 
 # Extract data for plot 2
-# Data needed for the Williamson-Hall plot
-sin_theta_lambda = data2_williamson_hall.iloc[0, 2:].astype(float)
-beta_cos_theta_lambda = data2_williamson_hall.iloc[1, 2:].astype(float)
+# Data needed for the Williamson-Hall plot (the values start in the third column)
+wh_values = data2_williamson_hall.iloc[:2, 2:].to_numpy(dtype=float)
+sin_theta_lambda = wh_values[0]
+beta_cos_theta_lambda = wh_values[1]
 
-# Perform linear regression to calculate slope, intercept, and other stats
-slope, intercept, r_value, p_value, std_err = linregress(
-    sin_theta_lambda, beta_cos_theta_lambda
-)
+
+# Function to fit a straight line by least squares
+def fit_line(x, y):
+    """
+    Fit y = slope * x + intercept by ordinary least squares (as scipy's linregress).
+
+    Parameters:
+        x (numpy.ndarray): Independent variable.
+        y (numpy.ndarray): Dependent variable.
+
+    Returns:
+        tuple: Slope, intercept and standard error of the slope.
+    """
+    x_dev = x - x.mean()
+    sxx = np.dot(x_dev, x_dev)
+    slope = np.dot(x_dev, y) / sxx
+    intercept = y.mean() - slope * x.mean()
+    residuals = y - (slope * x + intercept)
+    std_err = np.sqrt(np.dot(residuals, residuals) / (len(x) - 2) / sxx)
+    return slope, intercept, std_err
+
+
+# Perform linear regression to calculate the slope, intercept and standard error
+slope, intercept, std_err = fit_line(sin_theta_lambda, beta_cos_theta_lambda)
 
 # Calculate the regression line and error bounds
 x_fit = np.linspace(2.0, 7.0, 100)
@@ -134,13 +167,17 @@ ax1.plot(
 )
 
 
-# Plot Bragg peaks
-label = r"$\mathrm{Bragg \,\, peaks \,\, (Pt \,\, fcc \,\, structure)}$"
-for x, y in zip(bragg_peaks_twotheta, bragg_peaks):
-    if pd.notna(x):
-        ax1.plot([x, x], [0, y], color="green", linestyle="-", label=label)
-        if label:
-            label = None  # Ensure the label is only shown once in the legend
+# Plot Bragg peaks as vertical lines (one artist with a single legend entry)
+has_peak = ~np.isnan(bragg_peaks_twotheta)
+ax1.vlines(
+    bragg_peaks_twotheta[has_peak],
+    0,
+    bragg_peaks[has_peak],
+    color="green",
+    linestyle="-",
+    capstyle="projecting",  # Same line ends as plot()
+    label=r"$\mathrm{Bragg \,\, peaks \,\, (Pt \,\, fcc \,\, structure)}$",
+)
 
 # Annotate the plot with reflection indices
 for hkl, v in p_target_dict.items():
@@ -160,9 +197,7 @@ ax1.set_ylabel(r"$\mathrm{Intensity} \ (\mathrm{a.u.})$", fontsize=20)
 ax1.grid(axis="x", which="major", color="gray", linestyle="--", linewidth=0.5)
 
 # Add comma formatting for y-axis tick labels
-ax1.yaxis.set_major_formatter(
-    ticker.FuncFormatter(lambda x, pos: f"{int(x):,}" if x >= 10000 else f"{int(x)}")
-)
+ax1.yaxis.set_major_formatter(ticker.StrMethodFormatter("{x:,.0f}"))
 
 # Add legend
 ax1.legend(loc="upper center", bbox_to_anchor=(0.35, 1))
@@ -202,5 +237,6 @@ ax_inset.grid(True)
 # Save and display the combined plot
 output_file_path = "./figures/xrd_data2.png"
 print(f"The plot will be saved to: {output_file_path}")
-plt.savefig(output_file_path, dpi=300)
-plt.show()
+plt.savefig(output_file_path, dpi=FIG_DPI)
+if SHOW_PLOTS:
+    plt.show()